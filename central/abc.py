@@ -11,6 +11,8 @@ class Config(object):
     The config is read only.
     """
 
+    __slots__ = ()
+
     def get(self, key, default=None):
         """
         Get the value for given key if key is in the configuration, otherwise default.
@@ -203,8 +205,15 @@ class Config(object):
 class Reader(object):
     """
     Interface for reading a configuration from a specific stream as a dict.
+
+    An instance may be shared by many configs and threads,
+    so a reader must not hold state between reads.
     """
 
+    # True when the reader reads the raw bytes of an utf-8 stream,
+    # otherwise the stream is decoded before it is read.
+    binary = False
+
     def read(self, stream):
         """
         Read the given stream and returns it as a dict.
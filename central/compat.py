@@ -10,6 +10,9 @@ PY2 = int(sys.version_info[0]) == 2
 if PY2:
     import urllib2
     urlopen = urllib2.urlopen
+    HTTPError = urllib2.HTTPError
+    Request = urllib2.Request
+    URLError = urllib2.URLError
 
     from ConfigParser import ConfigParser
     ConfigParser = ConfigParser
@@ -20,8 +23,12 @@ if PY2:
 
     FileNotFoundError = OSError
 else:
+    import urllib.error
     import urllib.request
     urlopen = urllib.request.urlopen
+    HTTPError = urllib.error.HTTPError
+    Request = urllib.request.Request
+    URLError = urllib.error.URLError
 
     from configparser import ConfigParser
     ConfigParser = ConfigParser
@@ -7,6 +7,7 @@ import logging
 import os
 import sys
 
+from datetime import date, datetime, time
 from collections import KeysView, ItemsView, ValuesView, Mapping
 from .. import abc
 from ..compat import text_type, string_types
@@ -24,11 +25,77 @@ logger = logging.getLogger(__name__)
 NESTED_DELIMITER = '.'
 
 
+# marker used to tell a cached miss apart from a key not cached yet.
+_MISS = object()
+
+# nested keys split by the delimiter, shared by all the configs.
+_PATHS_CACHE = {}
+_PATHS_CACHE_SIZE = 4096
+
+# values cached by each config, the caches are cleared once full.
+_CACHE_SIZE = 4096
+
+# environment lookups do not hold state, so a single one is shared.
+_ENVIRONMENT_LOOKUP = EnvironmentLookup()
+
+# decoded values of these types are immutable, so they can be cached.
+_CACHEABLE_TYPES = frozenset([bool, int, float, str, text_type, date, datetime, time])
+
+
+def _same_value(a, b):
+    """
+    Compare the given values along with their types, including the values nested in them,
+    unlike `==` the values 1, 1.0 and True are not the same.
+    :param a: The first value.
+    :param b: The second value.
+    :return bool: True if the values are the same, otherwise False.
+    """
+    if type(a) is not type(b):
+        return False
+
+    if isinstance(a, Mapping):
+        # keys compared with their original case.
+        if set(a) != set(b):
+            return False
+
+        return all(_same_value(a[key], b[key]) for key in a)
+
+    if isinstance(a, (list, tuple)):
+        return len(a) == len(b) and all(_same_value(x, y) for x, y in zip(a, b))
+
+    # NaN is never equal to itself.
+    if isinstance(a, float) and a != a:
+        return b != b
+
+    return a == b
+
+
+def _copy_value(value):
+    """
+    Copy the given value along with the mappings and lists nested in it,
+    so the copy is not changed when the value is changed in place.
+    :param value: The value to be copied.
+    :return: The value copied.
+    """
+    if isinstance(value, Mapping):
+        return dict((key, _copy_value(value[key])) for key in value)
+
+    if isinstance(value, list):
+        return [_copy_value(item) for item in value]
+
+    if isinstance(value, tuple):
+        return tuple(_copy_value(item) for item in value)
+
+    return value
+
+
 class BaseConfig(abc.Config):
     """
     Base config class for implementing an `abc.Config`.
     """
 
+    __slots__ = ('_lookup', '_updated')
+
     def __init__(self):
         self._lookup = ConfigLookup(self)
         self._updated = EventHandler()
@@ -131,6 +198,10 @@ class BaseConfig(abc.Config):
         Set the lookup object used for interpolation.
         :param StrLookup value: The lookup object.
         """
+        # the lookup is already set on this config and its children.
+        if value is not None and value is self._lookup:
+            return
+
         if value is None:
             self._lookup = ConfigLookup(self)
         elif isinstance(value, abc.StrLookup):
@@ -231,11 +302,15 @@ class BaseDataConfig(BaseConfig):
     Base config class that holds keys.
     """
 
+    __slots__ = ('_data', '_decoder', '_interpolator', '_caches', '_resolve_lookup')
+
     def __init__(self):
         super(BaseDataConfig, self).__init__()
         self._data = IgnoreCaseDict()
         self._decoder = Decoder.instance()
         self._interpolator = BashInterpolator()
+        self._caches = (self._data, IgnoreCaseDict(), {})
+        self._resolve_lookup = None
 
     @property
     def decoder(self):
@@ -255,6 +330,7 @@ class BaseDataConfig(BaseConfig):
             raise TypeError('decoder must be an abc.Decoder')
 
         self._decoder = value
+        self._reset_raw_cache()
 
     @property
     def interpolator(self):
@@ -274,6 +350,7 @@ class BaseDataConfig(BaseConfig):
             raise TypeError('interpolator must be an abc.StrInterpolator')
 
         self._interpolator = value
+        self._reset_raw_cache()
 
     def get_raw(self, key):
         """
@@ -285,27 +362,47 @@ class BaseDataConfig(BaseConfig):
         if key is None:
             raise TypeError('key cannot be None')
 
-        value = self._data.get(key)
+        # the data and its cache are taken together, so a value read
+        # from the data being replaced by a reload never reaches the new cache.
+        data, raw_cache, _ = self._get_caches()
 
-        if value is not None:
+        value = raw_cache.get(key, _MISS)
+
+        if value is not _MISS:
             return value
 
-        paths = key.split(NESTED_DELIMITER)
+        try:
+            value = data[key]
+        except KeyError:
+            value = None
 
-        if key == paths[0]:
-            return None
+            # flat keys do not need to be split.
+            if NESTED_DELIMITER in key:
+                paths = _PATHS_CACHE.get(key)
+
+                if paths is None:
+                    if len(_PATHS_CACHE) >= _PATHS_CACHE_SIZE:
+                        _PATHS_CACHE.clear()
+
+                    paths = _PATHS_CACHE[key] = tuple(key.split(NESTED_DELIMITER))
+
+                value = data
 
-        value = self._data.get(paths[0])
+                for path in paths:
+                    if not isinstance(value, Mapping):
+                        value = None
+                        break
 
-        for i in range(1, len(paths)):
-            if value is None:
-                break
+                    try:
+                        value = value[path]
+                    except KeyError:
+                        value = None
+                        break
 
-            if not isinstance(value, Mapping):
-                value = None
-                break
+        if len(raw_cache) >= _CACHE_SIZE:
+            raw_cache.clear()
 
-            value = value.get(paths[i])
+        raw_cache[key] = value
 
         return value
 
@@ -325,21 +422,105 @@ class BaseDataConfig(BaseConfig):
         if type is None:
             raise TypeError('type cannot be None')
 
-        value = self.get_raw(key)
+        # taken before the raw value, if the data is replaced meanwhile
+        # the decoded value goes to the cache being discarded.
+        decoded_cache = self._get_caches()[2]
 
-        if value is None:
+        raw_value = self.get_raw(key)
+
+        if raw_value is None:
             if callable(default):
                 return default()
 
             return default
 
+        cacheable = type in _CACHEABLE_TYPES
+
+        if cacheable:
+            value = decoded_cache.get((key, type), _MISS)
+
+            if value is not _MISS:
+                return value
+
+        value = raw_value
+
         if isinstance(value, string_types):
             value = self._interpolator.resolve(value, self._lookup)
 
         if type is object:
             return value
 
-        return self._decoder.decode(value, type)
+        decoded_value = self._decoder.decode(value, type)
+
+        # an interpolated value depends on the lookup,
+        # so only the values left untouched are cached.
+        if cacheable and value is raw_value:
+            if len(decoded_cache) >= _CACHE_SIZE:
+                decoded_cache.clear()
+
+            decoded_cache[(key, type)] = decoded_value
+
+        return decoded_value
+
+    def _get_resolve_lookup(self):
+        """
+        Get the lookup used to resolve the variables of the names to be loaded,
+        it looks up the config first and then the environment variables.
+        The lookup is only created again when the config lookup is changed.
+        :return abc.StrLookup: The lookup.
+        """
+        resolve_lookup = self._resolve_lookup
+
+        if resolve_lookup is None or resolve_lookup[0] is not self._lookup:
+            resolve_lookup = self._resolve_lookup = (self._lookup, ChainLookup(_ENVIRONMENT_LOOKUP, self._lookup))
+
+        return resolve_lookup[1]
+
+    def _get_caches(self):
+        """
+        Get the data along with the raw values cached by `get_raw`
+        and the values decoded by `get_value` from that data.
+        The caches belong to the data they were built from,
+        loading the configuration assigns a new data object.
+        :return tuple: The data, the raw values cache and the decoded values cache.
+        """
+        caches = self._caches
+
+        if caches[0] is not self._data:
+            caches = self._caches = (self._data, IgnoreCaseDict(), {})
+
+        return caches
+
+    def _get_raw_data(self):
+        """
+        Get the raw values of the configuration by key,
+        without filling the caches of the configuration.
+        :return Mapping: The raw values by key.
+        """
+        return self._data
+
+    def _reset_raw_cache(self):
+        """
+        Discard the raw values cached by `get_raw` and the values decoded by `get_value`.
+        It must be called whenever the data is changed in place.
+        """
+        self._caches = (self._data, IgnoreCaseDict(), {})
+
+    def __getitem__(self, key):
+        """
+        Get the value if key is in the configuration, otherwise KeyError is raised.
+        :param str key: The key to be found.
+        :return: The value found.
+        """
+        value = self.get_raw(key)
+
+        if value is None:
+            raise KeyError(key)
+
+        if isinstance(value, string_types):
+            value = self._interpolator.resolve(value, self._lookup)
+
+        return value
 
     def __iter__(self):
         """
@@ -380,6 +561,9 @@ class ChainConfig(BaseConfig):
 
     :param configs: The list of `abc.Config`.
     """
+
+    __slots__ = ('_configs', '_configs_reversed', '_keys_cached', '_keys_len')
+
     def __init__(self, *configs):
         super(ChainConfig, self).__init__()
 
@@ -391,7 +575,9 @@ class ChainConfig(BaseConfig):
             config.updated.add(self._config_updated)
 
         self._configs = configs
+        self._configs_reversed = configs[::-1]
         self._keys_cached = None
+        self._keys_len = None
 
     @property
     def configs(self):
@@ -408,7 +594,7 @@ class ChainConfig(BaseConfig):
         :param str key: The key to be found.
         :return: The value found, otherwise None.
         """
-        for config in reversed(self._configs):
+        for config in self._configs_reversed:
             value = config.get_raw(key)
             if value is not None:
                 return value
@@ -424,7 +610,7 @@ class ChainConfig(BaseConfig):
         :param default: The default value if the key is not found.
         :return: The value found, otherwise default.
         """
-        for config in reversed(self._configs):
+        for config in self._configs_reversed:
             value = config.get_value(key, type)
             if value is not None:
                 return value
@@ -441,6 +627,7 @@ class ChainConfig(BaseConfig):
         This method does not trigger the updated event.
         """
         self._keys_cached = None
+        self._keys_len = None
 
         for config in self._configs:
             config.load()
@@ -453,6 +640,7 @@ class ChainConfig(BaseConfig):
         # reset the cache because the children's
         # configuration has been changed.
         self._keys_cached = None
+        self._keys_len = None
 
         self.updated()
 
@@ -462,7 +650,8 @@ class ChainConfig(BaseConfig):
         :param lookup: The new lookup object.
         """
         for config in self._configs:
-            config.lookup = lookup
+            if config.lookup is not lookup:
+                config.lookup = lookup
 
     def _build_cached_keys(self):
         """
@@ -484,6 +673,7 @@ class ChainConfig(BaseConfig):
         """
         if self._keys_cached is None:
             self._keys_cached = self._build_cached_keys()
+            self._keys_len = len(self._keys_cached)
         return self._keys_cached
 
     def __iter__(self):
@@ -498,7 +688,9 @@ class ChainConfig(BaseConfig):
         Get the number of keys.
         :return int: The number of keys.
         """
-        return len(self._get_cached_keys())
+        if self._keys_len is None:
+            self._get_cached_keys()
+        return self._keys_len
 
 
 class CommandLineConfig(BaseDataConfig):
@@ -531,12 +723,7 @@ class CommandLineConfig(BaseDataConfig):
 
         iterator = iter(args)
 
-        while True:
-            try:
-                current_arg = next(iterator)
-            except StopIteration:
-                break
-
+        for current_arg in iterator:
             key_start_index = 0
 
             if current_arg.startswith('--'):
@@ -545,25 +732,23 @@ class CommandLineConfig(BaseDataConfig):
             elif current_arg.startswith('-'):
                 key_start_index = 1
 
-            separator = current_arg.find('=')
+            key, separator, value = current_arg[key_start_index:].partition('=')
 
-            if separator == -1:
+            if not separator:
                 if key_start_index == 0:
                     raise ConfigError('Unrecognized argument %s format' % current_arg)
 
-                key = current_arg[key_start_index:]
-
                 try:
                     value = next(iterator)
                 except StopIteration:
                     raise ConfigError('Value for argument %s is missing' % key)
             else:
-                key = current_arg[key_start_index:separator].strip()
+                key = key.strip()
 
                 if not key:
                     raise ConfigError('Unrecognized argument %s format' % current_arg)
 
-                value = current_arg[separator + 1:].strip()
+                value = value.strip()
 
             data[key] = value
 
@@ -587,13 +772,72 @@ class EnvironmentConfig(BaseDataConfig):
 
     """
 
+    def __init__(self):
+        super(EnvironmentConfig, self).__init__()
+        self._environ = {}
+
+    def get_raw(self, key):
+        """
+        Get the raw value for given key if key is in the configuration, otherwise None.
+        Keys matching the case of the environment variable are found without
+        building the case insensitive view of the environment variables.
+        :param str key: The key to be found.
+        :return: The value found, otherwise None.
+        """
+        if key is None:
+            raise TypeError('key cannot be None')
+
+        value = self._environ.get(key)
+
+        if value is not None:
+            return value
+
+        self._build_data()
+
+        return super(EnvironmentConfig, self).get_raw(key)
+
     def load(self):
         """
         Load the configuration from environment variables.
 
         This method does not trigger the updated event.
         """
-        self._data = IgnoreCaseDict(os.environ)
+        self._environ = dict(os.environ)
+
+        # the case insensitive view is built on demand.
+        self._data = None
+        self._reset_raw_cache()
+
+    def _get_raw_data(self):
+        """
+        Get the raw values of the configuration by key,
+        without building the case insensitive view of the environment variables.
+        :return Mapping: The raw values by key.
+        """
+        return self._environ
+
+    def _build_data(self):
+        """
+        Build the case insensitive view of the environment variables loaded.
+        """
+        if self._data is None:
+            self._data = IgnoreCaseDict(self._environ)
+
+    def __iter__(self):
+        """
+        Get a new iterator object that can iterate over the keys of the configuration.
+        :return: The iterator.
+        """
+        self._build_data()
+        return iter(self._data)
+
+    def __len__(self):
+        """
+        Get the number of keys.
+        :return int: The number of keys.
+        """
+        self._build_data()
+        return len(self._data)
 
 
 class MemoryConfig(BaseDataConfig):
@@ -614,17 +858,25 @@ class MemoryConfig(BaseDataConfig):
 
         value = config.get('other key')
 
+    The data given may still be changed by its owner,
+    so the values read from it are not cached.
+
     :param dict data: The initial data.
     """
 
     def __init__(self, data=None):
         super(MemoryConfig, self).__init__()
 
+        self._owned = data is None
+
         if data is not None:
             if not isinstance(data, Mapping):
                 raise TypeError('data must be a dict')
 
-            self._data = make_ignore_case(data)
+            if not isinstance(data, IgnoreCaseDict):
+                data = make_ignore_case(data)
+
+            self._data = data
 
     def set(self, key, value):
         """
@@ -636,10 +888,11 @@ class MemoryConfig(BaseDataConfig):
         if key is None:
             raise TypeError('key cannot be None')
 
-        if isinstance(value, Mapping):
+        if isinstance(value, Mapping) and not isinstance(value, IgnoreCaseDict):
             value = make_ignore_case(value)
 
         self._data[key] = value
+        self._reset_raw_cache()
         self.updated()
 
     def load(self):
@@ -647,6 +900,17 @@ class MemoryConfig(BaseDataConfig):
         Do nothing
         """
 
+    def _get_caches(self):
+        """
+        Get the data along with the caches of the values read from it,
+        the caches are always empty if the data is shared with its owner.
+        :return tuple: The data, the raw values cache and the decoded values cache.
+        """
+        if self._owned:
+            return super(MemoryConfig, self)._get_caches()
+
+        return self._data, IgnoreCaseDict(), {}
+
 
 class MergeConfig(BaseDataConfig):
     """
@@ -668,9 +932,6 @@ class MergeConfig(BaseDataConfig):
     def __init__(self, *configs):
         super(MergeConfig, self).__init__()
 
-        if not isinstance(configs, (tuple, list)):
-            raise TypeError('configs must be a list or tuple')
-
         for config in configs:
             if not isinstance(config, abc.Config):
                 raise TypeError('config must be an abc.Config')
@@ -679,7 +940,6 @@ class MergeConfig(BaseDataConfig):
             config.updated.add(self._config_updated)
 
         self._configs = configs
-        self._raw_configs = [self._RawConfig(config) for config in self._configs]
 
     @property
     def configs(self):
@@ -704,7 +964,7 @@ class MergeConfig(BaseDataConfig):
         if len(self._configs) == 0:
             return data
 
-        merge_dict(data, *self._raw_configs)
+        merge_dict(data, *[self._RawConfig(config) for config in self._configs])
 
         self._data = data
 
@@ -715,36 +975,22 @@ class MergeConfig(BaseDataConfig):
         """
         self.updated()
 
-    class _RawConfig(Mapping):
+    class _RawConfig(dict):
         """
         Internal class used to merge a `abc.Config`.
 
         When we merge configs we want to merge the raw value
         rather than decoded and interpolated value.
-        """
-        def __init__(self, config):
-            self._config = config
-
-        def get(self, key, default=None):
-            value = self._config.get_raw(key)
-            if value is None:
-                return default
-            return value
-
-        def __contains__(self, key):
-            return key in self._config
 
-        def __getitem__(self, key):
-            value = self._config.get_raw(key)
-            if value is None:
-                raise KeyError(key)
-            return value
+        The raw values are copied up front so the merge
+        reads from a plain dict.
+        """
 
-        def __iter__(self):
-            return iter(self._config)
+        __slots__ = ()
 
-        def __len__(self):
-            return len(self._config)
+        def __init__(self, config):
+            super(MergeConfig._RawConfig, self).__init__(
+                (key, config.get_raw(key)) for key in config)
 
 
 class ModuleConfig(BaseDataConfig):
@@ -791,9 +1037,8 @@ class ModuleConfig(BaseDataConfig):
         to_merge = []
         name = self._name
 
-        # create a chain lookup to resolve any variable left
-        # using environment variable.
-        lookup = ChainLookup(EnvironmentLookup(), self._lookup)
+        # resolve any variable left using environment variable.
+        lookup = self._get_resolve_lookup()
 
         while name:
             o = self._import_module(self._interpolator.resolve(name, lookup))
@@ -847,6 +1092,9 @@ class PrefixedConfig(BaseConfig):
     :param str prefix: The prefix to prepend to the keys.
     :param abc.Config config: The config to load the keys from.
     """
+
+    __slots__ = ('_prefix', '_prefix_delimited', '_prefix_length', '_config')
+
     def __init__(self, prefix, config):
         super(PrefixedConfig, self).__init__()
 
@@ -858,6 +1106,7 @@ class PrefixedConfig(BaseConfig):
 
         self._prefix = prefix.rstrip(NESTED_DELIMITER)
         self._prefix_delimited = prefix if prefix.endswith(NESTED_DELIMITER) else prefix + NESTED_DELIMITER
+        self._prefix_length = len(self._prefix_delimited)
         self._config = config
         self._config.lookup = self.lookup
 
@@ -886,12 +1135,10 @@ class PrefixedConfig(BaseConfig):
         if key is None:
             raise TypeError('key cannot be None')
 
-        try:
-            key = self._prefix_delimited + key
-        except TypeError:
+        if not isinstance(key, string_types):
             raise TypeError('key must be a str')
 
-        return self._config.get_raw(key)
+        return self._config.get_raw(self._prefix_delimited + key)
 
     def get_value(self, key, type, default=None):
         """
@@ -904,12 +1151,10 @@ class PrefixedConfig(BaseConfig):
         if key is None:
             raise TypeError('key cannot be None')
 
-        try:
-            key = self._prefix_delimited + key
-        except TypeError:
+        if not isinstance(key, string_types):
             raise TypeError('key must be a str')
 
-        return self._config.get_value(key, type, default=default)
+        return self._config.get_value(self._prefix_delimited + key, type, default=default)
 
     def load(self):
         """
@@ -926,41 +1171,40 @@ class PrefixedConfig(BaseConfig):
         """
         self._config.lookup = lookup
 
-    def __iter__(self):
+    def _iter_keys(self):
         """
-        Get a new iterator object that can iterate over the keys of the configuration.
-        :return: The iterator.
+        Iterate over the keys of the child configuration that are prefixed,
+        the keys are yielded without the prefix and they may be repeated.
+        :return: The generator.
         """
-        keys = set()
+        prefix = self._prefix
+        prefix_delimited = self._prefix_delimited
+        prefix_length = self._prefix_length
 
         for key in self._config:
-            if key == self._prefix:
+            if key == prefix:
                 value = self._config.get(key)
                 if isinstance(value, Mapping):
-                    keys.update(value.keys())
+                    for subkey in value:
+                        yield subkey
 
-            elif key.startswith(self._prefix_delimited):
-                keys.update((key[len(self._prefix_delimited):],))
+            elif key.startswith(prefix_delimited):
+                yield key[prefix_length:]
 
-        return iter(keys)
+    def __iter__(self):
+        """
+        Get a new iterator object that can iterate over the keys of the configuration.
+        :return: The iterator.
+        """
+        # a dict drops the repeated keys and keeps the order they were found.
+        return iter(dict.fromkeys(self._iter_keys()))
 
     def __len__(self):
         """
         Get the number of keys.
         :return int: The number of keys.
         """
-        length = 0
-
-        for key in self._config:
-            if key == self._prefix:
-                value = self._config.get(key)
-                if isinstance(value, Mapping):
-                    length += len(value)
-
-            elif key.startswith(self._prefix_delimited):
-                length += 1
-
-        return length
+        return len(dict.fromkeys(self._iter_keys()))
 
 
 class ReloadConfig(BaseConfig):
@@ -980,6 +1224,9 @@ class ReloadConfig(BaseConfig):
 
         value = config.get('key')
 
+    The updated event is only triggered when the reloaded
+    configuration differs from the previous one.
+
     :param abc.Config config: The config to be reloaded from time to time.
     :param abc.Scheduler scheduler: The scheduler used to reload the configuration from the child.
     """
@@ -996,6 +1243,7 @@ class ReloadConfig(BaseConfig):
         self._config.lookup = self.lookup
         self._scheduler = scheduler
         self._loaded = False
+        self._snapshot = None
 
     @property
     def config(self):
@@ -1040,13 +1288,16 @@ class ReloadConfig(BaseConfig):
         """
         self._config.load()
 
+        self._snapshot = self._take_snapshot()
+
         if not self._loaded:
             self._scheduler.schedule(self._reload)
             self._loaded = True
 
     def _reload(self):
         """
-        Reload the child configuration and trigger the updated event.
+        Reload the child configuration and trigger the updated event
+        if the configuration has changed.
         It is only intended to be called by the scheduler.
         """
         try:
@@ -1054,11 +1305,35 @@ class ReloadConfig(BaseConfig):
         except:
             logger.warning('Unable to load config ' + text_type(self._config), exc_info=True)
 
+        snapshot = self._take_snapshot()
+
+        if snapshot is not None and self._snapshot is not None and _same_value(snapshot, self._snapshot):
+            return
+
+        self._snapshot = snapshot
+
         try:
             self.updated()
         except:
             logger.warning('Error calling updated event from ' + str(self), exc_info=True)
 
+    def _take_snapshot(self):
+        """
+        Take a copy of the raw values of the child configuration,
+        they are compared after each reload to find out whether the configuration has changed.
+
+        The values are copied as a child may change them in place.
+        :return dict: The raw values by key, None if the child cannot be iterated.
+        """
+        try:
+            if isinstance(self._config, BaseDataConfig):
+                return _copy_value(self._config._get_raw_data())
+
+            return _copy_value(dict((key, self._config.get_raw(key)) for key in self._config))
+        except:
+            # a child that cannot be compared is always considered changed.
+            return None
+
     def _lookup_changed(self, lookup):
         """
         Set the new lookup to the child.
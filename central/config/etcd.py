@@ -194,6 +194,9 @@ class EtcdConfig(BaseDataConfig):
 
                 self._etcd_index = result.modifiedIndex + 1
 
+                # the data has been changed in place.
+                self._reset_raw_cache()
+
                 try:
                     self.updated()
                 except:
@@ -1,16 +1,21 @@
-import codecs
+import io
 import os
+import time
 
 from .. import abc
 from ..compat import string_types, FileNotFoundError
 from ..exceptions import ConfigError
-from ..interpolation import ChainLookup, EnvironmentLookup
-from ..readers import get_reader
+from ..readers import get_reader, get_reader_instance
 from ..structures import IgnoreCaseDict
 from ..utils import get_file_ext, merge_dict
 from .core import BaseDataConfig
 
 
+# files modified within this amount of seconds before being read
+# may be modified again without changing the timestamps (e.g: FAT has 2 seconds).
+_RACY_INTERVAL = 2
+
+
 class FileConfig(BaseDataConfig):
     """
     A config implementation that loads the configuration
@@ -42,6 +47,7 @@ class FileConfig(BaseDataConfig):
 
         self._filename = filename
         self._reader = reader
+        self._files = None
 
     @property
     def filename(self):
@@ -66,7 +72,12 @@ class FileConfig(BaseDataConfig):
 
         This method does not trigger the updated event.
         """
-        to_merge = []
+        # nothing to read if none of the files has changed since the last load.
+        if self._files_unchanged():
+            return
+
+        data = None
+        files = []
         filename = self.filename
 
         while filename:
@@ -75,24 +86,71 @@ class FileConfig(BaseDataConfig):
             if file is None:
                 raise FileNotFoundError('File %s not found' % filename)
 
-            data = self._read_file(file)
+            # the version is taken before reading so a change
+            # made while the file is read is picked up next time.
+            files.append((filename, file, self._get_file_version(file)))
 
-            if not isinstance(data, IgnoreCaseDict):
+            chunk = self._read_file(file)
+
+            if not isinstance(chunk, IgnoreCaseDict):
                 raise ConfigError('reader must return an IgnoreCaseDict object')
 
-            filename = data.pop('@next', None)
+            filename = chunk.pop('@next', None)
 
             if filename is not None and not isinstance(filename, string_types):
                 raise ConfigError('@next must be a str')
 
-            to_merge.append(data)
+            # most configurations are a single file, nothing to merge.
+            if data is None:
+                data = chunk
+            else:
+                merge_dict(data, chunk)
 
-        data = to_merge[0]
+        self._data = data
+        self._files = files
 
-        if len(to_merge) > 1:
-            merge_dict(data, *to_merge[1:])
+    def _files_unchanged(self):
+        """
+        Check whether the files read by the last load are still
+        the same files and none of them has been modified.
+        :return bool: True if the files are unchanged, otherwise False.
+        """
+        if not self._files:
+            return False
 
-        self._data = data
+        for filename, file, version in self._files:
+            if version is None:
+                return False
+
+            if self._find_file(filename) != file:
+                return False
+
+            if self._get_file_version(file) != version:
+                return False
+
+        return True
+
+    def _get_file_version(self, filename):
+        """
+        Get a version of the given file that changes whenever the file is modified.
+
+        The change time is part of the version as tools like `cp -p` and `rsync -t`
+        keep the modification time, and a file modified too recently to be told apart
+        from a later modification has no version, the same as git "racy" files.
+        :param str filename: The filename.
+        :return tuple: The version of the file, None if it is unknown.
+        """
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            return None
+
+        if time.time() - max(stat.st_mtime, stat.st_ctime) < _RACY_INTERVAL:
+            return None
+
+        return (stat.st_ino, stat.st_size,
+                getattr(stat, 'st_mtime_ns', stat.st_mtime),
+                getattr(stat, 'st_ctime_ns', stat.st_ctime))
 
     def _get_reader(self, filename):
         """
@@ -111,7 +169,7 @@ class FileConfig(BaseDataConfig):
         if reader_cls is None:
             raise ConfigError('File %s is not supported' % filename)
 
-        return reader_cls()
+        return get_reader_instance(reader_cls)
 
     def _find_file(self, filename):
         """
@@ -119,9 +177,8 @@ class FileConfig(BaseDataConfig):
         :param str filename: The filename to be found.
         :return: The filename if found, otherwise None.
         """
-        # create a chain lookup to resolve any variable left
-        # using environment variable.
-        lookup = ChainLookup(EnvironmentLookup(), self._lookup)
+        # resolve any variable left using environment variable.
+        lookup = self._get_resolve_lookup()
 
         # resolve variables.
         filename = self._interpolator.resolve(filename, lookup)
@@ -140,9 +197,10 @@ class FileConfig(BaseDataConfig):
         reader = self._reader or self._get_reader(filename)
 
         with self._open_file(filename) as stream:
-            text_reader_cls = codecs.getreader('utf-8')
+            if getattr(reader, 'binary', False):
+                return reader.read(stream)
 
-            with text_reader_cls(stream) as text_reader:
+            with io.TextIOWrapper(stream, encoding='utf-8') as text_reader:
                 return reader.read(text_reader)
 
     def _open_file(self, filename):
@@ -151,4 +209,4 @@ class FileConfig(BaseDataConfig):
         :param str filename: The filename to be read.
         :return: The stream to read the file content.
         """
-        return open(filename, mode='rb')
+        return io.open(filename, mode='rb')
@@ -5,17 +5,19 @@ S3 config implementation.
 import codecs
 import io
 
+from threading import Lock
+
 from .core import BaseDataConfig
 from .. import abc
 from ..compat import string_types
 from ..exceptions import ConfigError, LibraryRequiredError
-from ..interpolation import ChainLookup, EnvironmentLookup
-from ..readers import get_reader
+from ..readers import get_reader, get_reader_instance
 from ..structures import IgnoreCaseDict
-from ..utils import get_file_ext, merge_dict
+from ..utils import get_file_ext, merge_dict, prefetch
 
 try:
     import boto3
+    from botocore.exceptions import ClientError
 except:
     boto3 = None
 
@@ -25,6 +27,30 @@ __all__ = [
 ]
 
 
+# returned instead of a stream when the object has not been modified.
+_NOT_MODIFIED = object()
+
+# the client used by the configs created without a client.
+_default_client = None
+_default_client_lock = Lock()
+
+
+def _get_default_client():
+    """
+    Get the S3 client shared by the configs created without a client,
+    the client is created on its first use.
+    :return: The boto S3 client.
+    """
+    global _default_client
+
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = boto3.client('s3')
+
+    return _default_client
+
+
 class S3Config(BaseDataConfig):
     """
     A S3 configuration based on `BaseDataConfig`.
@@ -39,14 +65,20 @@ class S3Config(BaseDataConfig):
 
         from central.config.s3 import S3Config
 
-        s3 = boto3.resource('s3')
+        s3 = boto3.client('s3')
 
         config = S3Config(s3, 'bucket name', 'config.json')
         config.load()
 
         value = config.get('key')
 
-    :param client: The boto S3 resource.
+    When no client is given a S3 client shared by every S3Config is used,
+    so its connection pool is shared as well. A client given explicitly
+    can tune the pool, e.g:
+    ``boto3.client('s3', config=botocore.config.Config(max_pool_connections=20))``.
+
+    :param client: The boto S3 client, a S3 resource is also accepted,
+        if None the shared client is used.
     :param str bucket_name: The S3 bucket name.
     :param str filename: The file name to be read.
     :param abc.Reader reader: The reader used to read the file content as a dict,
@@ -59,9 +91,6 @@ class S3Config(BaseDataConfig):
 
         super(S3Config, self).__init__()
 
-        if client is None:
-            raise TypeError('client cannot be None')
-
         if not isinstance(bucket_name, string_types):
             raise TypeError('bucket_name must be a str')
 
@@ -71,10 +100,22 @@ class S3Config(BaseDataConfig):
         if reader is not None and not isinstance(reader, abc.Reader):
             raise TypeError('reader must be an abc.Reader')
 
+        if client is None:
+            client = _get_default_client()
+
+        # a resource is reduced to its low level client.
+        resource_client = getattr(getattr(client, 'meta', None), 'client', None)
+
+        if resource_client is not None:
+            client = resource_client
+
         self._client = client
         self._bucket_name = bucket_name
         self._filename = filename
         self._reader = reader
+        self._chain = ()
+        self._e_tags = {}
+        self._received = {}
 
     @property
     def bucket_name(self):
@@ -104,25 +145,52 @@ class S3Config(BaseDataConfig):
         """
         Load the configuration stored in the S3.
         Recursively load any filename referenced by an @next property in the response.
+
+        The files read by the previous load are requested again in parallel,
+        conditionally to the ETag of their objects,
+        nothing is read if none of them has been modified.
         """
+        # resolve any variable left using environment variable.
+        lookup = self._get_resolve_lookup()
+
+        self._received = {}
+
+        streams = {}
+
+        if self._chain:
+            fetched = prefetch(self._fetch_file, set(filename for _, filename in self._chain))
+            streams = dict((filename, fetched(filename)) for _, filename in self._chain)
+
+            if self._chain_unchanged(streams, lookup):
+                return
+
         to_merge = []
+        chain = []
         filename = self.filename
 
-        # create a chain lookup to resolve any variable left
-        # using environment variable.
-        lookup = ChainLookup(EnvironmentLookup(), self._lookup)
-
         while filename:
+            template = filename
+
             # resolve variables.
             filename = self._interpolator.resolve(filename, lookup)
 
+            chain.append((template, filename))
+
             reader = self._reader or self._get_reader(filename)
 
-            with self._open_file(filename) as stream:
-                text_reader_cls = codecs.getreader('utf-8')
+            stream = streams.pop(filename, None)
 
-                with text_reader_cls(stream) as text_reader:
-                    data = reader.read(text_reader)
+            if stream is None or stream is _NOT_MODIFIED:
+                stream = self._open_file(filename)
+
+            with stream:
+                if getattr(reader, 'binary', False):
+                    data = reader.read(stream)
+                else:
+                    text_reader_cls = codecs.getreader('utf-8')
+
+                    with text_reader_cls(stream) as text_reader:
+                        data = reader.read(text_reader)
 
             filename = data.pop('@next', None)
 
@@ -140,6 +208,46 @@ class S3Config(BaseDataConfig):
             merge_dict(data, *to_merge[1:])
 
         self._data = data
+        self._chain = tuple(chain)
+        self._e_tags = dict((filename, self._received[filename])
+                            for _, filename in chain if filename in self._received)
+
+    def _chain_unchanged(self, streams, lookup):
+        """
+        Check whether none of the files read by the last load has been modified
+        and each of them is still referenced by the same variables.
+        :param dict streams: The streams by filename.
+        :param abc.StrLookup lookup: The lookup used to resolve variables.
+        :return bool: True if the files are unchanged, otherwise False.
+        """
+        for template, filename in self._chain:
+            if streams.get(filename) is not _NOT_MODIFIED:
+                return False
+
+            if self._interpolator.resolve(template, lookup) != filename:
+                return False
+
+        return True
+
+    def _fetch_file(self, filename):
+        """
+        Open the given file from AWS S3,
+        the request is conditional if the file was read by the last load.
+        :param str filename: The filename to be read.
+        :return: The stream to read the file content,
+            `_NOT_MODIFIED` if the object has not been modified.
+        """
+        e_tag = self._e_tags.get(filename)
+
+        if e_tag is None:
+            return self._open_file(filename)
+
+        stream = self._open_file(filename, e_tag)
+
+        if stream is None:
+            return _NOT_MODIFIED
+
+        return stream
 
     def _get_reader(self, filename):
         """
@@ -158,21 +266,38 @@ class S3Config(BaseDataConfig):
         if reader_cls is None:
             raise ConfigError('File %s is not supported' % filename)
 
-        return reader_cls()
+        return get_reader_instance(reader_cls)
 
-    def _open_file(self, filename):
+    def _open_file(self, filename, e_tag=None):
         """
         Open the given file from AWS S3.
+
+        The ETag of the object is kept for the next load,
+        the request is conditional if the file is opened with it.
         :param str filename: The filename to be read.
-        :return: The stream to read the file content.
+        :param str e_tag: The ETag of the object from a previous request.
+        :return: The stream to read the file content, None if the object has not been modified.
         """
-        obj = self._client.Object(self._bucket_name, filename)
+        kwargs = {'Bucket': self._bucket_name, 'Key': filename}
 
-        stream = io.BytesIO()
+        if e_tag is not None:
+            kwargs['IfNoneMatch'] = e_tag
 
-        obj.download_fileobj(stream)
+        try:
+            response = self._client.get_object(**kwargs)
+        except ClientError as e:
+            if e_tag is not None and e.response.get('Error', {}).get('Code') == '304':
+                return None
+            raise
 
-        # move the pointer to the beginning of the stream.
-        stream.seek(0, 0)
+        body = response['Body']
 
-        return stream
+        try:
+            content = body.read()
+        finally:
+            body.close()
+
+        if response.get('ETag'):
+            self._received[filename] = response['ETag']
+
+        return io.BytesIO(content)
@@ -1,14 +1,91 @@
 import codecs
+import io
+
+from threading import Lock
 
 from .. import abc
-from ..compat import string_types, urlopen
+from ..compat import string_types, urlopen, HTTPError, Request, URLError
 from ..exceptions import ConfigError
-from ..interpolation import ChainLookup, EnvironmentLookup
-from ..readers import get_reader
+from ..readers import get_reader, get_reader_instance
 from ..structures import IgnoreCaseDict
-from ..utils import merge_dict
+from ..utils import merge_dict, prefetch
 from .core import BaseDataConfig
 
+try:
+    import urllib3
+except:
+    urllib3 = None
+
+
+# returned instead of a response when the content has not been modified.
+_NOT_MODIFIED = object()
+
+# the schemes requested through the pool manager, any other is left to urlopen.
+_POOL_SCHEMES = ('http://', 'https://')
+
+# the pool manager shared by every UrlConfig.
+_pool_manager = None
+_pool_manager_lock = Lock()
+
+# content types split into the mime type and the charset, shared by all the configs.
+_CONTENT_TYPES = {}
+_CONTENT_TYPES_SIZE = 256
+
+
+def _get_pool_manager():
+    """
+    Get the pool manager shared by every UrlConfig,
+    the pool manager is created on its first use.
+    :return urllib3.PoolManager: The pool manager.
+    """
+    global _pool_manager
+
+    if _pool_manager is None:
+        with _pool_manager_lock:
+            if _pool_manager is None:
+                _pool_manager = urllib3.PoolManager()
+
+    return _pool_manager
+
+
+def _parse_content_type(content_type):
+    """
+    Parse the given content type into its mime type and its charset,
+    the same content type is usually received on every load so it is parsed once.
+    :param str content_type: The content type from the response.
+    :return tuple: The mime type and the charset, None if there is no charset.
+    """
+    parsed = _CONTENT_TYPES.get(content_type)
+
+    if parsed is not None:
+        return parsed
+
+    # e.g: application/json;charset=iso-8859-x
+
+    pairs = content_type.split(';')
+
+    charset = None
+
+    # skip the mime type
+    for pair in pairs[1:]:
+        kv = pair.split('=')
+        if len(kv) != 2:
+            continue
+
+        key = kv[0].strip()
+        value = kv[1].strip()
+
+        if key == 'charset' and value:
+            charset = value
+            break
+
+    if len(_CONTENT_TYPES) >= _CONTENT_TYPES_SIZE:
+        _CONTENT_TYPES.clear()
+
+    parsed = _CONTENT_TYPES[content_type] = (pairs[0], charset)
+
+    return parsed
+
 
 class UrlConfig(BaseDataConfig):
     """
@@ -26,10 +103,15 @@ class UrlConfig(BaseDataConfig):
 
         value = config.get('time')
 
+    When the library urllib3 is installed the http and https urls are read
+    through a thread-safe pool manager shared by every UrlConfig, so the connections
+    are kept alive and reused between loads. The errors raised are the same as `urlopen`.
+
     :param str url: The url to be read.
     :param abc.Reader reader: The reader used to read the response from url as a dict,
         if None a reader based on the content type of the response is going to be used.
     """
+
     def __init__(self, url, reader=None):
         super(UrlConfig, self).__init__()
 
@@ -41,6 +123,10 @@ class UrlConfig(BaseDataConfig):
 
         self._url = url
         self._reader = reader
+        self._reader_names = {}
+        self._chain = ()
+        self._validators = {}
+        self._received = {}
 
     @property
     def url(self):
@@ -63,30 +149,57 @@ class UrlConfig(BaseDataConfig):
         Load the configuration from a url.
         Recursively load any url referenced by an @next property in the response.
 
+        The urls read by the previous load are requested again in parallel,
+        conditionally to the ETag and Last-Modified values of their responses,
+        nothing is read if none of them has been modified.
+
         This method does not trigger the updated event.
         """
+        # resolve any variable left using environment variable.
+        lookup = self._get_resolve_lookup()
+
+        self._received = {}
+
+        responses = {}
+
+        if self._chain:
+            fetched = prefetch(self._fetch_url, set(url for _, url in self._chain))
+            responses = dict((url, fetched(url)) for _, url in self._chain)
+
+            if self._chain_unchanged(responses, lookup):
+                return
+
         to_merge = []
+        chain = []
         url = self.url
 
-        # create a chain lookup to resolve any variable left
-        # using environment variable.
-        lookup = ChainLookup(EnvironmentLookup(), self._lookup)
-
         while url:
+            template = url
+
             # resolve variables.
             url = self._interpolator.resolve(url, lookup)
 
-            content_type, stream = self._open_url(url)
+            chain.append((template, url))
+
+            response = responses.pop(url, None)
+
+            if response is None or response is _NOT_MODIFIED:
+                response = self._open_url(url)
+
+            content_type, stream = response
 
             try:
                 reader = self._reader or self._get_reader(url, content_type)
 
                 encoding = self._get_encoding(content_type)
 
-                text_reader_cls = codecs.getreader(encoding)
+                if getattr(reader, 'binary', False) and codecs.lookup(encoding).name == 'utf-8':
+                    data = reader.read(stream)
+                else:
+                    text_reader_cls = codecs.getreader(encoding)
 
-                with text_reader_cls(stream) as text_reader:
-                    data = reader.read(text_reader)
+                    with text_reader_cls(stream) as text_reader:
+                        data = reader.read(text_reader)
             finally:
                 stream.close()
 
@@ -106,6 +219,53 @@ class UrlConfig(BaseDataConfig):
             merge_dict(data, *to_merge[1:])
 
         self._data = data
+        self._chain = tuple(chain)
+        self._validators = dict((url, self._received[url]) for _, url in chain if url in self._received)
+
+    def _chain_unchanged(self, responses, lookup):
+        """
+        Check whether none of the urls read by the last load has been modified
+        and each of them is still referenced by the same variables.
+        :param dict responses: The responses by url.
+        :param abc.StrLookup lookup: The lookup used to resolve variables.
+        :return bool: True if the urls are unchanged, otherwise False.
+        """
+        for template, url in self._chain:
+            if responses.get(url) is not _NOT_MODIFIED:
+                return False
+
+            if self._interpolator.resolve(template, lookup) != url:
+                return False
+
+        return True
+
+    def _fetch_url(self, url):
+        """
+        Open the given url and read the whole response,
+        so the response is not left open if it is not used.
+        The request is conditional if the url was read by the last load.
+        :param str url: The url to be read.
+        :return tuple: The content type and the stream to read from,
+            `_NOT_MODIFIED` if the content has not been modified.
+        """
+        validators = self._validators.get(url)
+
+        if validators is None:
+            response = self._open_url(url)
+        else:
+            response = self._open_url(url, validators)
+
+            if response is None:
+                return _NOT_MODIFIED
+
+        content_type, stream = response
+
+        try:
+            content = stream.read()
+        finally:
+            stream.close()
+
+        return content_type, io.BytesIO(content)
 
     def _get_reader(self, url, content_type):
         """
@@ -115,6 +275,28 @@ class UrlConfig(BaseDataConfig):
         :param str content_type: The content type used to guess the appropriated reader.
         :return abc.Reader: A reader.
         """
+        key = (url, content_type)
+
+        names = self._reader_names.get(key)
+
+        if names is None:
+            names = self._reader_names[key] = self._get_reader_names(url, content_type)
+
+        for name in names:
+            reader_cls = get_reader(name)
+            if reader_cls:
+                return get_reader_instance(reader_cls)
+
+        raise ConfigError('Response from %s provided content type %s which is not supported' % (url, content_type))
+
+    def _get_reader_names(self, url, content_type):
+        """
+        Get the names of the readers that may read the response,
+        guessed from the url and the content type.
+        :param str url: The url used to guess the reader names.
+        :param str content_type: The content type used to guess the reader names.
+        :return tuple: The reader names.
+        """
         names = []
 
         if content_type:
@@ -123,8 +305,7 @@ class UrlConfig(BaseDataConfig):
             # text/yaml
             # text/x-yaml
 
-            if ';' in content_type:
-                content_type = content_type.split(';')[0]
+            content_type = _parse_content_type(content_type)[0]
 
             if '.' in content_type:
                 names.append(content_type.split('.')[-1])
@@ -145,12 +326,7 @@ class UrlConfig(BaseDataConfig):
             if '.' in path:
                 names.append(path.split('.')[-1])
 
-        for name in names:
-            reader_cls = get_reader(name)
-            if reader_cls:
-                return reader_cls()
-
-        raise ConfigError('Response from %s provided content type %s which is not supported' % (url, content_type))
+        return tuple(names)
 
     def _get_encoding(self, content_type, default='utf-8'):
         """
@@ -162,30 +338,61 @@ class UrlConfig(BaseDataConfig):
         if not content_type:
             return default
 
-        # e.g: application/json;charset=iso-8859-x
+        return _parse_content_type(content_type)[1] or default
 
-        pairs = content_type.split(';')
+    def _open_url(self, url, validators=None):
+        """
+        Open the given url and returns its content type and the stream to read it.
 
-        # skip the mime type
-        for pair in pairs[1:]:
-            kv = pair.split('=')
-            if len(kv) != 2:
-                continue
+        The ETag and Last-Modified values of the response are kept for the next load,
+        the request is conditional if the url is opened with them.
+        :param url: The url to be opened.
+        :param tuple validators: The ETag and Last-Modified values of a previous response.
+        :return tuple: The content type and the stream to read from,
+            None if the content has not been modified.
+        """
+        headers = {}
 
-            key = kv[0].strip()
-            value = kv[1].strip()
+        if validators is not None:
+            etag, last_modified = validators
 
-            if key == 'charset' and value:
-                return value
+            if etag:
+                headers['If-None-Match'] = etag
 
-        return default
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
 
-    def _open_url(self, url):
-        """
-        Open the given url and returns its content type and the stream to read it.
-        :param url: The url to be opened.
-        :return tuple: The content type and the stream to read from.
-        """
-        response = urlopen(url)
-        content_type = response.headers.get('content-type')
-        return content_type, response
+        if urllib3 is not None and url[:8].lower().startswith(_POOL_SCHEMES):
+            try:
+                response = _get_pool_manager().request('GET', url, headers=headers)
+            except urllib3.exceptions.HTTPError as e:
+                raise URLError(e)
+
+            if response.status == 304 and validators is not None:
+                return None
+
+            if response.status >= 400:
+                raise HTTPError(url, response.status, response.reason, response.headers, None)
+
+            response_headers = response.headers
+
+            # the content is read at once so the connection
+            # is released back to the pool.
+            stream = io.BytesIO(response.data)
+        else:
+            try:
+                stream = urlopen(Request(url, headers=headers))
+            except HTTPError as e:
+                if e.code == 304 and validators is not None:
+                    return None
+                raise
+
+            response_headers = stream.headers
+
+        etag = response_headers.get('etag')
+        last_modified = response_headers.get('last-modified')
+
+        if etag or last_modified:
+            self._received[url] = (etag, last_modified)
+
+        return response_headers.get('content-type'), stream
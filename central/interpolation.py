@@ -58,6 +58,11 @@ class BashInterpolator(abc.StrInterpolator):
         if not isinstance(lookup, abc.StrLookup):
             raise TypeError('lookup must be an abc.StrLookup')
 
+        # most values have no variables at all,
+        # a substring check is much cheaper than the regex.
+        if '${' not in value:
+            return value
+
         # TODO: implement bash variable expansion
         # https://www.gnu.org/software/bash/manual/html_node/Shell-Parameter-Expansion.html
 
@@ -2,12 +2,14 @@
 Reader implementations.
 """
 
+import io
 import json
 
 from . import abc
-from .compat import ConfigParser, PY2, string_types
+from .compat import binary_type, ConfigParser, PY2, string_types
 from .exceptions import LibraryRequiredError
 from .structures import IgnoreCaseDict
+from .utils import make_ignore_case
 
 try:
     import yaml
@@ -20,11 +22,23 @@ try:
 except:
     toml = None
 
+try:
+    import ijson
+except:
+    ijson = None
+
+try:
+    import orjson
+except:
+    orjson = None
+
 
 __all__ = [
     'add_reader',
     'get_reader',
+    'get_reader_instance',
     'remove_reader',
+    'IJsonReader',
     'IniReader',
     'JsonReader',
     'TomlReader',
@@ -34,10 +48,15 @@ __all__ = [
 
 __readers = {}
 
+__reader_instances = {}
+
 
 def add_reader(name, reader_cls):
     """
     Add a reader class.
+
+    A single instance of the reader class is shared by the configs,
+    so the reader must not hold state between reads and must be thread-safe.
     :param str name: The name of the reader.
     :param reader_cls: The reader class.
     """
@@ -62,6 +81,20 @@ def get_reader(name):
     return __readers.get(name)
 
 
+def get_reader_instance(reader_cls):
+    """
+    Get the shared instance of a reader class.
+    :param reader_cls: The reader class.
+    :return abc.Reader: The instance of the reader class.
+    """
+    reader = __reader_instances.get(reader_cls)
+
+    if reader is None:
+        reader = __reader_instances.setdefault(reader_cls, reader_cls())
+
+    return reader
+
+
 def remove_reader(name):
     """
     Remove a reader by name.
@@ -74,6 +107,51 @@ def remove_reader(name):
     return __readers.pop(name, None)
 
 
+class IJsonReader(abc.Reader):
+    """
+    A reader for json content that parses the stream incrementally,
+    the configuration is built while the content is read from the stream
+    rather than after the whole content is buffered.
+
+    The library ijson 3.1 or later must be installed.
+
+    Example usage:
+
+    .. code-block:: python
+
+        from central.readers import IJsonReader
+
+        reader = IJsonReader()
+
+        with open('config.json', 'rb') as f:
+            data = reader.read(f)
+
+    """
+
+    binary = True
+
+    def __init__(self):
+        # the numbers are read as float from ijson 3.1 onwards.
+        if not ijson or tuple(int(n) for n in ijson.__version__.split('.')[:2]) < (3, 1):
+            raise LibraryRequiredError('ijson 3.1+', 'https://pypi.python.org/pypi/ijson')
+
+    def read(self, stream):
+        """
+        Read the given stream and returns it as a dict.
+        :param stream: The stream to read the configuration from.
+        :return IgnoreCaseDict: The configuration read from the stream.
+        """
+        if stream is None:
+            raise ValueError('stream cannot be None')
+
+        data = IgnoreCaseDict()
+
+        for key, value in ijson.kvitems(stream, '', map_type=IgnoreCaseDict, use_float=True):
+            data[key] = value
+
+        return data
+
+
 class IniReader(abc.Reader):
     """
     A reader for ini content.
@@ -100,6 +178,72 @@ class IniReader(abc.Reader):
         if stream is None:
             raise ValueError('stream cannot be None')
 
+        # the parser of python 2 has a few quirks of its own,
+        # e.g: inline comments and rem lines.
+        if PY2:
+            return self._read_with_parser(stream)
+
+        content = stream.read()
+
+        data = self._read_simple(content)
+
+        if data is None:
+            data = self._read_with_parser(io.StringIO(content))
+
+        return data
+
+    def _read_simple(self, content):
+        """
+        Read the given content if it only has sections of `key = value` lines,
+        which is the usual ini content, producing the same result as `ConfigParser`.
+        :param str content: The content to be read.
+        :return IgnoreCaseDict: The configuration read, None if the content needs `ConfigParser`.
+        """
+        data = IgnoreCaseDict()
+        section = None
+
+        for line in content.split('\n'):
+            stripped = line.strip()
+
+            if not stripped or stripped[0] in '#;':
+                continue
+
+            # continuation lines of multiline values.
+            if line[0].isspace():
+                return None
+
+            if stripped[0] == '[':
+                if stripped[-1] != ']':
+                    return None
+
+                name = stripped[1:-1]
+
+                if not name or name == 'DEFAULT' or name in data:
+                    return None
+
+                section = data[name] = IgnoreCaseDict()
+                continue
+
+            key, delimiter, value = line.partition('=')
+
+            if section is None or not delimiter or ':' in key or ';' in value:
+                return None
+
+            key = key.strip().lower()
+
+            if not key or key in section:
+                return None
+
+            section[key] = value.strip()
+
+        return data
+
+    def _read_with_parser(self, stream):
+        """
+        Read the given stream using `ConfigParser`.
+        :param stream: The stream to read the configuration from.
+        :return IgnoreCaseDict: The configuration read from the stream.
+        """
         parser = ConfigParser()
 
         if PY2:
@@ -110,10 +254,7 @@ class IniReader(abc.Reader):
         data = IgnoreCaseDict()
 
         for section in parser.sections():
-            data_section = data[section] = IgnoreCaseDict()
-
-            for option in parser.options(section):
-                data_section[option] = parser.get(section, option, raw=True)
+            data[section] = IgnoreCaseDict(parser.items(section, raw=True))
 
         return data
 
@@ -122,6 +263,8 @@ class JsonReader(abc.Reader):
     """
     A reader for json content.
 
+    The library orjson is used to parse the content when it is installed.
+
     Example usage:
 
     .. code-block:: python
@@ -135,6 +278,8 @@ class JsonReader(abc.Reader):
 
     """
 
+    binary = True
+
     def read(self, stream):
         """
         Read the given stream and returns it as a dict.
@@ -144,7 +289,24 @@ class JsonReader(abc.Reader):
         if stream is None:
             raise ValueError('stream cannot be None')
 
-        return json.load(stream, object_pairs_hook=IgnoreCaseDict)
+        content = stream.read()
+
+        if orjson is not None:
+            try:
+                data = orjson.loads(content)
+            except orjson.JSONDecodeError:
+                # orjson is stricter than json (e.g. NaN is rejected),
+                # so json has the final word about the content.
+                data = None
+
+            if isinstance(data, dict):
+                return make_ignore_case(data)
+
+        # json only reads bytes from python 3.6 onwards.
+        if isinstance(content, binary_type):
+            content = content.decode('utf-8')
+
+        return json.loads(content, object_pairs_hook=IgnoreCaseDict)
 
 
 class TomlReader(abc.Reader):
@@ -201,6 +363,10 @@ class YamlReader(abc.Reader):
 
     """
 
+    binary = True
+
+    _loader = None
+
     def __init__(self):
         if not yaml:
             raise LibraryRequiredError('PyYAML', 'https://pypi.python.org/pypi/PyYAML')
@@ -220,15 +386,23 @@ class YamlReader(abc.Reader):
         """
         Get a loader that uses an IgnoreCaseDict for
         complex objects.
+
+        The loader is based on the safe loader, backed by
+        libyaml when PyYAML has been built with it.
         :return yaml.Loader: The loader object.
         """
+        if YamlReader._loader is not None:
+            return YamlReader._loader
+
+        base_loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
         # this class was copied from
         # https://github.com/fmenabe/python-yamlordereddictloader/blob/master/yamlordereddictloader.py
         # and adapted to use IgnoreCaseDict
 
-        class Loader(yaml.Loader):
+        class Loader(base_loader):
             def __init__(self, *args, **kwargs):
-                yaml.Loader.__init__(self, *args, **kwargs)
+                base_loader.__init__(self, *args, **kwargs)
                 self.add_constructor(
                     'tag:yaml.org,2002:map', type(self).construct_yaml_map)
                 self.add_constructor(
@@ -261,6 +435,8 @@ class YamlReader(abc.Reader):
 
                 return mapping
 
+        YamlReader._loader = Loader
+
         return Loader
 
 
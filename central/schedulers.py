@@ -3,6 +3,7 @@ Scheduler implementations.
 """
 
 import logging
+import random
 
 from numbers import Number
 from threading import Event, Thread
@@ -34,17 +35,34 @@ class FixedIntervalScheduler(abc.Scheduler):
 
         scheduler.schedule(lambda: print('hit'))
 
+    Every scheduled function runs on its own timer, so functions
+    scheduled together run together. A jitter delays each execution
+    by a random amount of seconds, spreading the executions of many
+    functions (e.g: several configs being reloaded) along the interval.
+
+    .. code-block:: python
+
+        scheduler = FixedIntervalScheduler(interval=60, jitter=6)
+
     :param Number interval: The interval in seconds between executions.
+    :param Number jitter: The maximum random delay in seconds added to each execution.
     """
 
-    def __init__(self, interval=10):
+    def __init__(self, interval=10, jitter=0):
         if not isinstance(interval, Number):
             raise TypeError('interval must be a number')
 
         if not (interval > 0):
             raise ValueError('interval must be greater than 0')
 
+        if not isinstance(jitter, Number):
+            raise TypeError('jitter must be a number')
+
+        if jitter < 0:
+            raise ValueError('jitter must be greater than or equal to 0')
+
         self._interval = interval
+        self._jitter = jitter
         self._closed = Event()
 
     @property
@@ -55,6 +73,14 @@ class FixedIntervalScheduler(abc.Scheduler):
         """
         return self._interval
 
+    @property
+    def jitter(self):
+        """
+        Get the jitter.
+        :return int: The maximum random delay in seconds.
+        """
+        return self._jitter
+
     def schedule(self, func):
         """
         Schedule a given func to be executed between the interval.
@@ -76,7 +102,12 @@ class FixedIntervalScheduler(abc.Scheduler):
         :param func: The func to be called.
         """
         while not self._closed.is_set():
-            if self._closed.wait(self._interval):
+            timeout = self._interval
+
+            if self._jitter:
+                timeout += random.uniform(0, self._jitter)
+
+            if self._closed.wait(timeout):
                 break
 
             try:
@@ -22,10 +22,10 @@ class IgnoreCaseDict(MutableMapping):
         self._store = {}
 
         if seq:
-            self.update(seq)
+            self._update_store(seq)
 
         if kwargs:
-            self.update(kwargs)
+            self._update_store(kwargs)
 
     def clear(self):
         self._store.clear()
@@ -34,10 +34,15 @@ class IgnoreCaseDict(MutableMapping):
         return self.__class__(self)
 
     def get(self, key, default=__marker):
-        try:
-            pair = self._store.get(key.lower(), self.__marker)
-        except AttributeError:
-            raise TypeError('key must be a str')
+        # keys are stored in lower case, looking up the key as given
+        # first saves the lower() call for keys already in lower case.
+        pair = self._store.get(key, self.__marker)
+
+        if pair is self.__marker:
+            try:
+                pair = self._store.get(key.lower(), self.__marker)
+            except AttributeError:
+                raise TypeError('key must be a str')
 
         if pair is not self.__marker:
             return pair[1]
@@ -65,9 +70,38 @@ class IgnoreCaseDict(MutableMapping):
         _, pair = self._store.popitem()
         return pair[0], pair[1]
 
+    def update(self, *args, **kwargs):
+        if len(args) > 1:
+            raise TypeError('update expected at most 1 arguments, got %d' % len(args))
+
+        if args and args[0]:
+            self._update_store(args[0])
+
+        if kwargs:
+            self._update_store(kwargs)
+
+    def _update_store(self, seq):
+        """
+        Add the given mapping or sequence of pairs straight into the store,
+        it saves going through `__setitem__` for every key.
+        :param seq: The mapping or sequence of pairs.
+        """
+        pairs = seq
+
+        if hasattr(seq, 'keys'):
+            pairs = ((key, seq[key]) for key in seq.keys())
+
+        try:
+            self._store.update((key.lower(), (key, value)) for key, value in pairs)
+        except AttributeError:
+            raise TypeError('key must be a str')
+
     __copy__ = copy
 
     def __contains__(self, key):
+        if key in self._store:
+            return True
+
         try:
             return key.lower() in self._store
         except AttributeError:
@@ -80,6 +114,11 @@ class IgnoreCaseDict(MutableMapping):
             raise TypeError('key must be a str')
 
     def __getitem__(self, key):
+        pair = self._store.get(key)
+
+        if pair is not None:
+            return pair[1]
+
         try:
             return self._store[key.lower()][1]
         except AttributeError:
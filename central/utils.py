@@ -5,6 +5,7 @@ Utility module
 import os
 
 from collections import Mapping, MutableMapping
+from threading import Thread
 from .structures import IgnoreCaseDict
 
 
@@ -14,12 +15,25 @@ def get_file_ext(filename):
     :param str filename: The filename.
     :return str: The extension.
     """
-    return os.path.splitext(filename)[1].strip('.')
+    i = filename.rfind('.')
+
+    j = filename.rfind('/')
+
+    if os.sep != '/':
+        j = max(j, filename.rfind(os.sep))
+
+    # the dot must be in the last part of the path
+    # and not only a leading dot of it, e.g: .bashrc
+    if i <= j or not filename[j + 1:i].lstrip('.'):
+        return ''
+
+    return filename[i + 1:]
 
 
 def make_ignore_case(data):
     """
-    Convert the given `Mapping` into an `IgnoreCaseDict`.
+    Convert the given `Mapping` into an `IgnoreCaseDict`,
+    including the mappings inside lists.
     :param Mapping data: The object to be converted.
     :return IgnoreCaseDict: The object converted to IgnoreCaseDict.
     """
@@ -29,22 +43,81 @@ def make_ignore_case(data):
     d = IgnoreCaseDict()
 
     for key in data:
-        value = data.get(key)
+        d[key] = _make_value_ignore_case(data.get(key))
 
-        if isinstance(value, Mapping):
-            value = make_ignore_case(value)
+    return d
 
-        d[key] = value
 
-    return d
+def _make_value_ignore_case(value):
+    """
+    Convert the mappings found in the given value into `IgnoreCaseDict`.
+    :param value: The value to be converted.
+    :return: The value converted.
+    """
+    if isinstance(value, Mapping):
+        return make_ignore_case(value)
+
+    if isinstance(value, list):
+        return [_make_value_ignore_case(item) for item in value]
+
+    return value
+
+
+def prefetch(func, args):
+    """
+    Call the given func with each argument, each call in its own background thread.
+
+    The returned function waits for the call made with the given argument
+    and returns its result, the result can only be taken once.
+    None is returned if no call was made with the argument or if the call has failed,
+    the caller is expected to make the call again so any error is raised.
+    :param func: The func to be called.
+    :param args: The arguments, the func is called once for each argument.
+    :return: The function to take the result of a call.
+    """
+    threads = {}
+    results = {}
+
+    def call(arg):
+        try:
+            results[arg] = func(arg)
+        except:
+            pass
+
+    for arg in args:
+        if arg in threads:
+            continue
+
+        thread = threads[arg] = Thread(target=call, args=(arg,), name='prefetch')
+        thread.daemon = True
+        thread.start()
+
+    def get(arg):
+        thread = threads.pop(arg, None)
+
+        if thread is None:
+            return None
+
+        thread.join()
+
+        return results.pop(arg, None)
+
+    return get
 
 
 def merge_dict(target, *sources):
     """
     Merge the given list of `Mapping` objects into `target` object.
+
+    The nested mappings of the sources may be placed into `target` as they are,
+    they are copied before anything is merged into them so the sources are never modified.
     :param MutableMapping target: The mapping to receive the merge.
     :param tuple sources: The list of `mapping` objects to be merged.
     """
+    # the ids of the nested mappings copied by this merge,
+    # any other nested mapping may be shared with a source.
+    owned = set()
+
     for source in sources:
         if not isinstance(target, MutableMapping):
             raise TypeError('target must be a dict')
@@ -52,18 +125,38 @@ def merge_dict(target, *sources):
         if not isinstance(source, Mapping):
             raise TypeError('data must be a dict')
 
-        for key in source:
-            target_value = target.get(key)
-            source_value = source[key]
+        # nested dicts are merged from a stack rather than recursively.
+        stack = [(target, source)]
+
+        while stack:
+            target_dict, source_dict = stack.pop()
+
+            # without nested dicts to be merged every value of
+            # the source replaces the value of the target.
+            if not target_dict or not any(isinstance(value, Mapping) for value in source_dict.values()):
+                target_dict.update(source_dict)
+                continue
+
+            for key, source_value in source_dict.items():
+                target_value = target_dict.get(key)
 
-            if target_value is None or source_value is None:
-                target[key] = source_value
+                if target_value is None or source_value is None:
+                    target_dict[key] = source_value
 
-            elif isinstance(target_value, Mapping) and isinstance(source_value, Mapping):
-                merge_dict(target_value, source_value)
+                elif isinstance(target_value, Mapping) and isinstance(source_value, Mapping):
+                    if id(target_value) not in owned:
+                        if isinstance(target_value, IgnoreCaseDict):
+                            target_value = target_value.copy()
+                        else:
+                            target_value = dict(target_value)
 
-            else:
-                target[key] = source_value
+                        target_dict[key] = target_value
+                        owned.add(id(target_value))
+
+                    stack.append((target_value, source_value))
+
+                else:
+                    target_dict[key] = source_value
 
 
 class EventHandler(object):
@@ -73,6 +166,9 @@ class EventHandler(object):
     :param after_add_func: The func called after adding a new callback.
     :param after_remove_func: The func called after removing a callback.
     """
+
+    __slots__ = ('_after_add_func', '_after_remove_func', '_callbacks')
+
     def __init__(self, after_add_func=None, after_remove_func=None):
         if after_add_func and not callable(after_add_func):
             raise TypeError('after_add_func must be callable object')
@@ -82,7 +178,11 @@ class EventHandler(object):
 
         self._after_add_func = after_add_func
         self._after_remove_func = after_remove_func
-        self._callbacks = []
+
+        # callbacks are added and removed rarely but called often,
+        # so a new tuple is built on changes and it is iterated as is,
+        # even if a callback is added or removed while being called.
+        self._callbacks = ()
 
     def __call__(self, *args):
         """
@@ -92,7 +192,8 @@ class EventHandler(object):
         passing the sender of the EventHandler as first argument and the
         optional args as second, third, ... argument to them.
         """
-        return [callback(*args) for callback in self._callbacks]
+        for callback in self._callbacks:
+            callback(*args)
 
     def __len__(self):
         """
@@ -116,7 +217,7 @@ class EventHandler(object):
         if not callable(callback):
             raise TypeError("callback must be callable")
 
-        self._callbacks.append(callback)
+        self._callbacks += (callback,)
 
         if self._after_add_func:
             self._after_add_func()
@@ -129,7 +230,10 @@ class EventHandler(object):
         if not callable(callback):
             raise TypeError("callback must be callable")
 
-        self._callbacks.remove(callback)
+        callbacks = list(self._callbacks)
+        callbacks.remove(callback)
+
+        self._callbacks = tuple(callbacks)
 
         if self._after_remove_func:
             self._after_remove_func()
@@ -141,6 +245,9 @@ class Version(object):
 
     :param int number: The initial version number.
     """
+
+    __slots__ = ('_number', '_changed')
+
     def __init__(self, number=0):
         self._number = number
         self._changed = EventHandler()
@@ -255,6 +255,16 @@ class BaseConfigMixin(object):
 
 
 class BaseDataConfigMixin(BaseConfigMixin):
+    def test_get_resolve_lookup_with_same_lookup(self):
+        config = self._create_base_config()
+        config2 = self._create_base_config()
+
+        lookup = config._get_resolve_lookup()
+        self.assertIs(lookup, config._get_resolve_lookup())
+
+        config.lookup = config2.lookup
+        self.assertIsNot(lookup, config._get_resolve_lookup())
+
     def test_get_decoder_with_default_value(self):
         config = self._create_base_config()
         self.assertEqual(Decoder, type(config.decoder))
@@ -112,6 +112,19 @@ class TestCommandLineConfig(TestCase, BaseDataConfigMixin):
 
         self.assertEqual('', config['key1'])
 
+    def test_load_with_cached_key(self):
+        config = CommandLineConfig()
+        self.assertIsNone(config.get_raw('key1'))
+
+        sys.argv = [
+            'filename.py',
+            'key1=value'
+        ]
+
+        config.load()
+
+        self.assertEqual('value', config.get_raw('key1'))
+
     def _create_base_config(self, load_data=False):
         config = CommandLineConfig()
 
@@ -139,6 +152,26 @@ class TestEnvironmentConfig(TestCase, BaseDataConfigMixin):
         os.environ.pop('key_int', None)
         os.environ.pop('key_interpolated', None)
 
+    def test_get_value_with_exact_case_key(self):
+        config = self._create_base_config(load_data=True)
+        self.assertEqual('value', config.get_value('key_ignore_case', str))
+        self.assertEqual('value1', config.get_value('key_IGNORE_case', str))
+
+    def test_load_with_new_variable(self):
+        config = self._create_base_config(load_data=True)
+        self.assertIsNone(config.get_raw('key_new'))
+
+        os.environ['key_new'] = 'value'
+
+        try:
+            self.assertIsNone(config.get_raw('KEY_NEW'))
+
+            config.load()
+
+            self.assertEqual('value', config.get_raw('KEY_NEW'))
+        finally:
+            os.environ.pop('key_new', None)
+
     def _create_base_config(self, load_data=False):
         config = EnvironmentConfig()
 
@@ -191,6 +224,21 @@ class TestChainConfig(TestCase, BaseConfigMixin):
 
         self.assertEqual(config.lookup, child.lookup)
 
+    def test_child_lookup_with_same_value(self):
+        lookups = []
+
+        class Config(MemoryConfig):
+            def _lookup_changed(self, lookup):
+                lookups.append(lookup)
+
+        child = Config()
+
+        config = ChainConfig(child)
+        config.lookup = config.lookup
+        ChainConfig(config)
+
+        self.assertEqual(2, len(lookups))
+
     def test_get_value_with_overridden_key(self):
         config = ChainConfig(
             MemoryConfig(data={'key': 1}),
@@ -351,6 +399,69 @@ class TestMemoryConfig(TestCase, BaseDataConfigMixin):
         config.set('key1', 'value1')
         self.assertEqual('value1', config['key1'])
 
+    def test_set_with_cached_key(self):
+        config = MemoryConfig()
+        self.assertIsNone(config.get_raw('key.item'))
+
+        config.set('key', {'item': 'value'})
+        self.assertEqual('value', config.get_raw('key.item'))
+
+        config.set('KEY', {'item': 'value2'})
+        self.assertEqual('value2', config.get_raw('key.ITEM'))
+
+    def test_get_raw_with_data_changed_by_owner(self):
+        data = IgnoreCaseDict(key=IgnoreCaseDict(item='value'))
+
+        config = MemoryConfig(data=data)
+        self.assertEqual('value', config.get_raw('key.item'))
+        self.assertEqual('value', config.get_str('key.item'))
+
+        data['key']['item'] = 'value2'
+        self.assertEqual('value2', config.get_raw('key.item'))
+        self.assertEqual('value2', config.get_str('key.item'))
+
+    def test_get_raw_with_many_keys(self):
+        from central.config.core import _CACHE_SIZE
+
+        config = MemoryConfig()
+
+        for i in range(_CACHE_SIZE + 10):
+            config.get_raw('key%d' % i)
+
+        self.assertLessEqual(len(config._caches[1]), _CACHE_SIZE)
+
+    def test_get_raw_with_data_replaced_while_reading(self):
+        class Data(IgnoreCaseDict):
+            def __getitem__(self, key):
+                # a reload and a read happening in other threads.
+                config._data = IgnoreCaseDict(key='new value')
+                config.get_raw('other')
+                return 'old value'
+
+        config = MemoryConfig()
+        config._data = Data(key='old value')
+
+        self.assertEqual('old value', config.get_raw('key'))
+        self.assertEqual('new value', config.get_raw('key'))
+
+    def test_set_with_decoded_key(self):
+        config = MemoryConfig(data={'key': '1'})
+        self.assertEqual(1, config.get_int('key'))
+
+        config.set('key', '2')
+        self.assertEqual(2, config.get_int('key'))
+
+    def test_get_value_with_interpolated_key_changed(self):
+        config = MemoryConfig(data={'key': '${other_key}'})
+        other_config = MemoryConfig(data={'other_key': '1'})
+
+        ChainConfig(other_config, config)
+
+        self.assertEqual(1, config.get_int('key'))
+
+        other_config.set('other_key', '2')
+        self.assertEqual(2, config.get_int('key'))
+
     def test_set_with_dict_as_value(self):
         config = MemoryConfig()
         config.set('key', {'item': {'subitem': 'value'}})
@@ -536,7 +647,11 @@ class TestReloadConfig(TestCase, BaseConfigMixin):
         self.assertTrue(ev.is_set())
 
     def test_reload_with_updated_error(self):
-        config = MemoryConfig().reload_every(0.005)
+        class CounterConfig(MemoryConfig):
+            def load(self):
+                self.set('counter', (self.get('counter') or 0) + 1)
+
+        config = CounterConfig().reload_every(0.005)
 
         ev = Event()
 
@@ -551,6 +666,93 @@ class TestReloadConfig(TestCase, BaseConfigMixin):
 
         self.assertTrue(ev.is_set())
 
+    def test_reload_with_unchanged_config(self):
+        ev = Event()
+
+        config = MemoryConfig(data={'key': 'value'}).reload_every(0.005)
+
+        @config.on_updated
+        def updated():
+            ev.set()
+
+        config.load()
+
+        self.assertFalse(ev.wait(0.05))
+
+        config.config.set('key', 'new value')
+
+        self.assertTrue(ev.wait(0.5))
+
+    def test_reload_with_value_changed_to_equal_value_of_other_type(self):
+        from central.config.core import _same_value
+
+        self.assertFalse(_same_value({'key': 1}, {'key': True}))
+        self.assertFalse(_same_value({'key': 1}, {'key': 1.0}))
+        self.assertFalse(_same_value({'key': {'item': [1]}}, {'key': {'item': [1.0]}}))
+        self.assertFalse(_same_value({'key': 1}, {'KEY': 1}))
+        self.assertTrue(_same_value({'key': {'item': [1, float('nan')]}}, {'key': {'item': [1, float('nan')]}}))
+
+        ev = Event()
+
+        config = MemoryConfig(data={'key': 1}).reload_every(0.005)
+
+        @config.on_updated
+        def updated():
+            ev.set()
+
+        config.load()
+
+        config.config.set('key', True)
+
+        self.assertTrue(ev.wait(0.5))
+        self.assertEqual('True', config.get_str('key'))
+
+    def test_reload_with_value_changed_in_place(self):
+        # the data is kept as it is given when it is an IgnoreCaseDict.
+        data = IgnoreCaseDict(db=IgnoreCaseDict(host='h1'))
+
+        config = MemoryConfig(data=data).reload_every(60)
+
+        updates = []
+        config.updated.add(lambda: updates.append(True))
+
+        config.load()
+        config._reload()
+
+        self.assertEqual(0, len(updates))
+
+        data['db']['host'] = 'h2'
+        config._reload()
+
+        self.assertEqual(1, len(updates))
+        self.assertEqual('h2', config.get('db.host'))
+
+    def test_reload_merged_configs_with_value_changed(self):
+        m1 = MemoryConfig(data={'db': {'host': 'h1'}})
+        m2 = MemoryConfig(data={'db': {'host': 'h2'}})
+
+        config = MergeConfig(m1, m2).reload_every(60)
+
+        updates = []
+        config.updated.add(lambda: updates.append(True))
+
+        config.load()
+
+        m2.set('db', {'host': 'h3'})
+        config._reload()
+
+        self.assertEqual(1, len(updates))
+        self.assertEqual('h3', config.get('db.host'))
+
+    def test_reload_without_building_environment_view(self):
+        child = EnvironmentConfig()
+
+        config = ReloadConfig(child, FixedIntervalScheduler(interval=60))
+        config.load()
+        config._reload()
+
+        self.assertIsNone(child._data)
+
     def _create_base_config(self, load_data=False):
         config = MemoryConfig()
 
@@ -595,6 +797,12 @@ class TestPrefixedConfig(TestCase, BaseConfigMixin):
         config = PrefixedConfig('prefix', config=child)
         self.assertEqual(child, config.config)
 
+    def test_len_with_repeated_key(self):
+        child = MemoryConfig(data={'prefix': {'key': 1}, 'prefix.key': 2, 'prefix.other_key': 3})
+        config = PrefixedConfig('prefix', config=child)
+        self.assertEqual(2, len(config))
+        self.assertEqual(len(list(config)), len(config))
+
     def _create_base_config(self, load_data=False):
         config = MemoryConfig()
 
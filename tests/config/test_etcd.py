@@ -0,0 +1,97 @@
+from __future__ import absolute_import
+
+from central.config.etcd import EtcdConfig
+from central.exceptions import LibraryRequiredError
+from threading import Event
+from unittest import TestCase
+
+
+class Item(object):
+    def __init__(self, key, value=None, dir=False, action=None):
+        self.key = key
+        self.value = value
+        self.dir = dir
+        self.action = action
+
+
+class Result(object):
+    def __init__(self, items, index):
+        self.items = items
+        self.etcd_index = index
+        self.modifiedIndex = index
+
+    def get_subtree(self):
+        return self.items
+
+
+class Client(object):
+    def __init__(self, items, events):
+        self.items = items
+        self.events = list(events)
+        self.closed = Event()
+
+    def read(self, path, recursive):
+        return Result([Item(path, dir=True)] + self.items, 1)
+
+    def watch(self, path, index, recursive):
+        import etcd
+
+        if self.events:
+            return Result([self.events.pop(0)], index)
+
+        self.closed.wait(0.01)
+        raise etcd.EtcdWatchTimedOut()
+
+
+class TestEtcdConfig(TestCase):
+    def test_etcd_not_installed(self):
+        from central.config import etcd
+        etcd_tmp = etcd.etcd
+        etcd.etcd = None
+
+        try:
+            with self.assertRaises(LibraryRequiredError):
+                EtcdConfig(object(), '/config')
+        finally:
+            etcd.etcd = etcd_tmp
+
+    def test_init_client_with_none_value(self):
+        with self.assertRaises(TypeError):
+            EtcdConfig(None, '/config')
+
+    def test_init_path_with_int_value(self):
+        with self.assertRaises(TypeError):
+            EtcdConfig(object(), 123)
+
+    def test_load(self):
+        client = Client([Item('/config/key', 'value')], [])
+
+        config = EtcdConfig(client, '/config')
+        config.load()
+        config.close()
+
+        self.assertEqual('value', config.get('key'))
+
+    def test_watch_with_cached_key(self):
+        client = Client([Item('/config/key', 'v1')], [Item('/config/key', 'v2', action='set')])
+
+        ev = Event()
+
+        config = EtcdConfig(client, '/config')
+        config.on_updated(ev.set)
+
+        # the value is read before the watch event arrives.
+        client.events, events = [], client.events
+
+        config.load()
+        self.assertEqual('v1', config.get('key'))
+
+        client.events = events
+
+        try:
+            self.assertTrue(ev.wait(1))
+        finally:
+            config.close()
+            client.closed.set()
+
+        self.assertEqual('v2', config.get('key'))
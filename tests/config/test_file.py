@@ -1,5 +1,9 @@
 from __future__ import absolute_import
 
+import os
+import shutil
+import tempfile
+
 from central import abc
 from central.compat import FileNotFoundError
 from central.config.file import FileConfig
@@ -36,6 +40,12 @@ class TestFileConfig(TestCase, BaseDataConfigMixin, NextMixin):
         config = FileConfig('config.json', reader=reader)
         self.assertEqual(reader, config.reader)
 
+    def test_get_reader_with_same_extension(self):
+        config = FileConfig('config.json')
+        reader = config._get_reader('config.json')
+        self.assertIsInstance(reader, JsonReader)
+        self.assertIs(reader, config._get_reader('other.json'))
+
     def test_load_with_unknown_file_extension(self):
         class Config(FileConfig):
             def _find_file(self, filename):
@@ -110,6 +120,105 @@ class TestFileConfig(TestCase, BaseDataConfigMixin, NextMixin):
         with self.assertRaises(ConfigError):
             config.load()
 
+    def _create_counting_config(self, content):
+        path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, path)
+
+        filename = os.path.join(path, 'config.json')
+
+        with open(filename, 'w') as f:
+            f.write(content)
+
+        files_read = []
+
+        class Config(FileConfig):
+            def _read_file(self, filename):
+                files_read.append(filename)
+                return super(Config, self)._read_file(filename)
+
+        return Config(filename), files_read
+
+    def _disable_racy_interval(self):
+        from central.config import file
+
+        racy_interval_tmp = file._RACY_INTERVAL
+        file._RACY_INTERVAL = 0
+        self.addCleanup(setattr, file, '_RACY_INTERVAL', racy_interval_tmp)
+
+    def test_load_merged_with_unchanged_file(self):
+        from central.config import MergeConfig
+
+        self._disable_racy_interval()
+
+        path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, path)
+
+        filename1 = os.path.join(path, 'config1.json')
+        filename2 = os.path.join(path, 'config2.json')
+
+        with open(filename1, 'w') as f:
+            f.write('{"db": {"host": "h1", "port": 1}}')
+
+        with open(filename2, 'w') as f:
+            f.write('{"db": {"host": "h3"}}')
+
+        config = MergeConfig(FileConfig(filename1), FileConfig(filename2))
+        config.load()
+
+        self.assertEqual('h3', config.get('db.host'))
+
+        with open(filename2, 'w') as f:
+            f.write('{"db": {}}')
+
+        config.load()
+
+        # the unchanged file is not modified by the previous merge.
+        self.assertEqual('h1', config.get('db.host'))
+        self.assertEqual(1, config.get('db.port'))
+
+    def test_load_with_unchanged_file(self):
+        self._disable_racy_interval()
+
+        config, files_read = self._create_counting_config('{"key": "value"}')
+        config.load()
+        config.load()
+
+        self.assertEqual(1, len(files_read))
+        self.assertEqual('value', config.get('key'))
+
+        with open(config.filename, 'w') as f:
+            f.write('{"key": "new value"}')
+
+        config.load()
+
+        self.assertEqual(2, len(files_read))
+        self.assertEqual('new value', config.get('key'))
+
+    def test_load_with_file_modified_keeping_size_and_mtime(self):
+        self._disable_racy_interval()
+
+        config, files_read = self._create_counting_config('{"timeout": 10}')
+        config.load()
+
+        stat = os.stat(config.filename)
+
+        with open(config.filename, 'w') as f:
+            f.write('{"timeout": 20}')
+
+        os.utime(config.filename, (stat.st_atime, stat.st_mtime))
+
+        config.load()
+
+        self.assertEqual(2, len(files_read))
+        self.assertEqual(20, config.get('timeout'))
+
+    def test_load_with_racy_file(self):
+        config, files_read = self._create_counting_config('{"key": "value"}')
+        config.load()
+        config.load()
+
+        self.assertEqual(2, len(files_read))
+
     def _create_base_config(self, load_data=False):
         class Config(FileConfig):
             def _find_file(self, filename):
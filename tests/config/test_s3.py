@@ -26,8 +26,21 @@ class TestS3Config(TestCase, BaseDataConfigMixin, NextMixin):
         s3.boto3 = boto3_tmp
 
     def test_init_client_with_none_value(self):
-        with self.assertRaises(TypeError):
-            S3Config(client=None, bucket_name='bucket name', filename='config.json')
+        from central.config import s3
+
+        client = object()
+
+        client_tmp = s3._default_client
+        s3._default_client = client
+
+        try:
+            config1 = S3Config(client=None, bucket_name='bucket name', filename='config.json')
+            config2 = S3Config(client=None, bucket_name='bucket name', filename='config.json')
+        finally:
+            s3._default_client = client_tmp
+
+        self.assertIs(client, config1._client)
+        self.assertIs(client, config2._client)
 
     def test_init_bucket_name_with_none_value(self):
         with self.assertRaises(TypeError):
@@ -66,6 +79,79 @@ class TestS3Config(TestCase, BaseDataConfigMixin, NextMixin):
         config = S3Config(client=self.s3, bucket_name='bucket name', filename='config.json', reader=reader)
         self.assertEqual(reader, config.reader)
 
+    def test_get_reader_with_same_extension(self):
+        config = S3Config(client=self.s3, bucket_name='bucket name', filename='config.json')
+        reader = config._get_reader('config.json')
+        self.assertIsInstance(reader, JsonReader)
+        self.assertIs(reader, config._get_reader('other.json'))
+
+    def test_init_client_with_resource_value(self):
+        class Meta(object):
+            client = object()
+
+        self.s3.meta = Meta()
+
+        config = S3Config(client=self.s3, bucket_name='bucket name', filename='config.json')
+        self.assertIs(Meta.client, config._client)
+
+    def test_load_with_unchanged_object(self):
+        from botocore.exceptions import ClientError
+
+        requests = []
+
+        def get_object(**kwargs):
+            requests.append(kwargs)
+
+            if kwargs.get('IfNoneMatch') == '"123"':
+                raise ClientError({'Error': {'Code': '304', 'Message': 'Not Modified'}}, 'GetObject')
+
+            return {'ETag': '"123"', 'Body': BytesIO(b'{"key": "value"}')}
+
+        self.s3.get_object = get_object
+
+        config = S3Config(client=self.s3, bucket_name='bucket name', filename='config.json')
+        config.load()
+
+        data = config._data
+
+        config.load()
+
+        self.assertEqual(2, len(requests))
+        self.assertEqual({'Bucket': 'bucket name', 'Key': 'config.json'}, requests[0])
+        self.assertEqual({'Bucket': 'bucket name', 'Key': 'config.json', 'IfNoneMatch': '"123"'}, requests[1])
+        self.assertIs(data, config._data)
+        self.assertEqual({'config.json': '"123"'}, config._e_tags)
+        self.assertEqual('value', config.get('key'))
+
+    def test_load_with_modified_object(self):
+        from botocore.exceptions import ClientError
+
+        requests = []
+        objects = {'config.json': ('"1"', b'{"key": "value"}')}
+
+        def get_object(**kwargs):
+            requests.append(kwargs)
+
+            e_tag, content = objects[kwargs['Key']]
+
+            if kwargs.get('IfNoneMatch') == e_tag:
+                raise ClientError({'Error': {'Code': '304', 'Message': 'Not Modified'}}, 'GetObject')
+
+            return {'ETag': e_tag, 'Body': BytesIO(content)}
+
+        self.s3.get_object = get_object
+
+        config = S3Config(client=self.s3, bucket_name='bucket name', filename='config.json')
+        config.load()
+
+        objects['config.json'] = ('"2"', b'{"key": "value2"}')
+
+        config.load()
+
+        self.assertEqual(2, len(requests))
+        self.assertEqual({'config.json': '"2"'}, config._e_tags)
+        self.assertEqual('value2', config.get('key'))
+
     def test_load_with_unknown_file_extension(self):
         class Config(S3Config):
             def _open_file(self, filename):
@@ -35,6 +35,247 @@ class TestUrlConfig(TestCase, BaseDataConfigMixin, NextMixin):
         config = UrlConfig('http://config.json', reader=reader)
         self.assertEqual(reader, config.reader)
 
+    def test_get_reader_with_same_content_type(self):
+        config = UrlConfig('http://example.com/config')
+        reader = config._get_reader('http://example.com/config', 'application/json')
+        self.assertIsInstance(reader, JsonReader)
+        self.assertIs(reader, config._get_reader('http://example.com/config', 'application/json'))
+
+    def test_get_encoding_with_same_content_type(self):
+        config = UrlConfig('http://example.com/config')
+        self.assertEqual('iso-8859-1', config._get_encoding('application/json; charset=iso-8859-1'))
+        self.assertEqual('iso-8859-1', config._get_encoding('application/json; charset=iso-8859-1'))
+        self.assertEqual('utf-8', config._get_encoding('application/json'))
+
+    def test_load_with_not_modified_response(self):
+        from central.compat import HTTPError
+        from central.config import url
+
+        requests = []
+
+        class Response(BytesIO):
+            headers = {'content-type': 'application/json', 'etag': '"123"'}
+
+        def urlopen(request):
+            requests.append(request)
+
+            if request.get_header('If-none-match') == '"123"':
+                raise HTTPError(request.get_full_url(), 304, 'Not Modified', {}, None)
+
+            return Response(b'{"key": "value"}')
+
+        urlopen_tmp = url.urlopen
+        url.urlopen = urlopen
+
+        urllib3_tmp = url.urllib3
+        url.urllib3 = None
+
+        try:
+            config = UrlConfig('http://example.com/config')
+            config.load()
+
+            data = config._data
+
+            config.load()
+        finally:
+            url.urlopen = urlopen_tmp
+            url.urllib3 = urllib3_tmp
+
+        self.assertEqual(2, len(requests))
+        self.assertIsNone(requests[0].get_header('If-none-match'))
+        self.assertIs(data, config._data)
+        self.assertEqual({'http://example.com/config': ('"123"', None)}, config._validators)
+        self.assertEqual('value', config.get('key'))
+
+    def test_load_with_next_modified(self):
+        from central.compat import HTTPError
+        from central.config import url
+
+        requests = []
+        versions = {'http://example.com/config': 1, 'http://example.com/config.next': 1}
+        contents = {
+            'http://example.com/config': b'{"@next": "http://example.com/config.next"}',
+            'http://example.com/config.next': b'{"key": "value%d"}',
+        }
+
+        class Response(BytesIO):
+            pass
+
+        def urlopen(request):
+            full_url = request.get_full_url()
+            etag = '"%d"' % versions[full_url]
+
+            requests.append((full_url, request.get_header('If-none-match')))
+
+            if request.get_header('If-none-match') == etag:
+                raise HTTPError(full_url, 304, 'Not Modified', {}, None)
+
+            content = contents[full_url]
+
+            if b'%d' in content:
+                content = content % versions[full_url]
+
+            response = Response(content)
+            response.headers = {'content-type': 'application/json', 'etag': etag}
+            return response
+
+        urlopen_tmp = url.urlopen
+        url.urlopen = urlopen
+
+        urllib3_tmp = url.urllib3
+        url.urllib3 = None
+
+        try:
+            config = UrlConfig('http://example.com/config')
+            config.load()
+
+            versions['http://example.com/config.next'] = 2
+
+            config.load()
+        finally:
+            url.urlopen = urlopen_tmp
+            url.urllib3 = urllib3_tmp
+
+        self.assertEqual('value2', config.get('key'))
+
+        # the head is not modified, but it is read again to be merged.
+        self.assertEqual(5, len(requests))
+        self.assertEqual(('http://example.com/config', None), requests[-1])
+
+    def test_load_with_shared_pool_manager(self):
+        from central.config import url
+
+        pool_managers = []
+
+        class Response(object):
+            status = 200
+            headers = {'content-type': 'application/json'}
+            data = b'{"key": "value"}'
+
+        class PoolManager(object):
+            def __init__(self):
+                pool_managers.append(self)
+
+            def request(self, method, url, headers):
+                return Response()
+
+        class Urllib3(object):
+            pass
+
+        urllib3 = Urllib3()
+        urllib3.PoolManager = PoolManager
+        urllib3.exceptions = url.urllib3.exceptions
+
+        urllib3_tmp = url.urllib3
+        url.urllib3 = urllib3
+
+        pool_manager_tmp = url._pool_manager
+        url._pool_manager = None
+
+        try:
+            config1 = UrlConfig('http://example.com/config1')
+            config1.load()
+            config1.load()
+
+            config2 = UrlConfig('http://example.com/config2')
+            config2.load()
+        finally:
+            url.urllib3 = urllib3_tmp
+            url._pool_manager = pool_manager_tmp
+
+        self.assertEqual(1, len(pool_managers))
+        self.assertEqual('value', config1.get('key'))
+        self.assertEqual('value', config2.get('key'))
+
+    def test_load_with_pool_manager_created_by_many_threads(self):
+        from central.config import url
+        from threading import Thread
+
+        pool_managers = []
+
+        class Urllib3(object):
+            class PoolManager(object):
+                def __init__(self):
+                    pool_managers.append(self)
+
+        urllib3_tmp = url.urllib3
+        url.urllib3 = Urllib3
+
+        pool_manager_tmp = url._pool_manager
+        url._pool_manager = None
+
+        try:
+            threads = [Thread(target=url._get_pool_manager) for _ in range(10)]
+
+            for thread in threads:
+                thread.start()
+
+            for thread in threads:
+                thread.join()
+        finally:
+            url.urllib3 = urllib3_tmp
+            url._pool_manager = pool_manager_tmp
+
+        self.assertEqual(1, len(pool_managers))
+
+    def test_load_with_pool_manager_and_error_status(self):
+        from central.compat import HTTPError
+        from central.config import url
+
+        class Response(object):
+            status = 404
+            reason = 'Not Found'
+            headers = {}
+
+        class PoolManager(object):
+            def request(self, method, url, headers):
+                return Response()
+
+        pool_manager_tmp = url._pool_manager
+        url._pool_manager = PoolManager()
+
+        try:
+            with self.assertRaises(HTTPError) as cm:
+                UrlConfig('http://example.com/config.json').load()
+        finally:
+            url._pool_manager = pool_manager_tmp
+
+        self.assertEqual(404, cm.exception.code)
+
+    def test_load_with_pool_manager_and_connection_error(self):
+        from central.compat import URLError
+        from central.config import url
+
+        class PoolManager(object):
+            def request(self, method, request_url, headers):
+                raise url.urllib3.exceptions.MaxRetryError(None, request_url)
+
+        pool_manager_tmp = url._pool_manager
+        url._pool_manager = PoolManager()
+
+        try:
+            with self.assertRaises(URLError):
+                UrlConfig('http://example.com/config.json').load()
+        finally:
+            url._pool_manager = pool_manager_tmp
+
+    def test_load_with_file_url(self):
+        import os
+        import tempfile
+
+        fd, filename = tempfile.mkstemp(suffix='.json')
+
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(b'{"key": "value"}')
+
+            config = UrlConfig('file://' + filename)
+            config.load()
+        finally:
+            os.remove(filename)
+
+        self.assertEqual('value', config.get('key'))
+
     def test_load_with_url_extension(self):
         class Config(UrlConfig):
             def _open_url(self, url):
@@ -184,6 +425,42 @@ class TestUrlConfig(TestCase, BaseDataConfigMixin, NextMixin):
         with self.assertRaises(LookupError):
             config.load()
 
+    def test_load_without_url_extension_and_non_utf8_charset(self):
+        class Config(UrlConfig):
+            def _open_url(self, url):
+                content_type = 'application/json;charset=iso-8859-1'
+                stream = BytesIO()
+                stream.write(u'{"key_str": "ol\xe1"}'.encode('iso-8859-1'))
+                stream.seek(0, 0)
+                return content_type, stream
+
+        config = Config('http://example.com/config')
+        config.load()
+
+        self.assertEqual(u'ol\xe1', config['key_str'])
+
+    def test_load_with_next_prefetched(self):
+        from threading import current_thread
+
+        threads = {}
+
+        class Config(UrlConfig):
+            def _open_url(self, url):
+                threads.setdefault(url, []).append(current_thread().name)
+
+                if url == 'http://example.com/config.json':
+                    return 'application/json', BytesIO(b'{"@next": "http://example.com/config.next.json"}')
+
+                return 'application/json', BytesIO(b'{"key": "value"}')
+
+        config = Config('http://example.com/config.json')
+        config.load()
+        config.load()
+
+        self.assertEqual(['prefetch'], threads['http://example.com/config.next.json'][1:])
+        self.assertEqual(['prefetch'], threads['http://example.com/config.json'][1:])
+        self.assertEqual('value', config.get('key'))
+
     def test_load_with_reader_case_sensitive(self):
         class Config(UrlConfig):
             def _open_url(self, url):
@@ -1,9 +1,13 @@
 from __future__ import absolute_import
 
+import math
+
 from central.exceptions import LibraryRequiredError
-from central.readers import add_reader, get_reader, remove_reader, IniReader, JsonReader, TomlReader, YamlReader
+from central.readers import (
+    add_reader, get_reader, get_reader_instance, remove_reader, IJsonReader, IniReader, JsonReader, TomlReader, YamlReader
+)
 from central.structures import IgnoreCaseDict
-from io import StringIO
+from io import BytesIO, StringIO
 from unittest import TestCase
 
 
@@ -32,18 +36,97 @@ class ReaderMixin(object):
         self.assertEqual(data.get('Database'), {'host': 'localhost', 'port': '1234'})
         self.assertEqual(data.get('Database').get('Host'), 'localhost')
 
+    def test_read_binary_stream_when_binary(self):
+        if not self.reader.binary:
+            self.skipTest('reader does not read bytes')
+
+        data = self.reader.read(BytesIO(self.data.encode('utf-8')))
+        self.assertEqual(data, {'database': {'host': 'localhost', 'port': '1234'}})
+
 
 class TestIniReader(TestCase, ReaderMixin):
     def setUp(self):
         self.reader = IniReader()
         self.data = u'[database]\nhost=localhost\nport=1234\n'
 
+    def test_read_multiline_value(self):
+        data = self.reader.read(StringIO(u'[database]\nhosts = host1\n  host2\n'))
+        self.assertEqual(data, {'database': {'hosts': 'host1\nhost2'}})
+
+    def test_read_default_section(self):
+        data = self.reader.read(StringIO(u'[DEFAULT]\nport = 1234\n[database]\nhost = localhost\n'))
+        self.assertEqual(data, {'database': {'host': 'localhost', 'port': '1234'}})
+
 
 class TestJsonReader(TestCase, ReaderMixin):
     def setUp(self):
         self.reader = JsonReader()
         self.data = u'{"database": {"host": "localhost", "port": "1234"}}'
 
+    def test_read_dict_inside_list(self):
+        data = self.reader.read(StringIO(u'{"servers": [{"Host": "localhost"}]}'))
+        self.assertIsInstance(data['servers'][0], IgnoreCaseDict)
+        self.assertEqual(data['servers'][0].get('host'), 'localhost')
+
+    def test_read_nan(self):
+        data = self.reader.read(StringIO(u'{"key": NaN}'))
+        self.assertTrue(math.isnan(data['key']))
+
+    def test_read_without_orjson(self):
+        from central import readers
+        orjson_tmp = readers.orjson
+        readers.orjson = None
+
+        try:
+            self.test_read_valid_stream()
+            self.test_read_ignore_case()
+            self.test_read_binary_stream_when_binary()
+
+            data = self.reader.read(BytesIO(u'{"key": "ol\xe1"}'.encode('utf-8')))
+            self.assertEqual(u'ol\xe1', data['key'])
+        finally:
+            readers.orjson = orjson_tmp
+
+
+class TestIJsonReader(TestCase, ReaderMixin):
+    def setUp(self):
+        try:
+            self.reader = IJsonReader()
+        except LibraryRequiredError:
+            self.skipTest('ijson 3.1+ is not installed')
+
+        self.data = u'{"database": {"host": "localhost", "port": "1234"}}'
+
+    def test_read_binary_stream(self):
+        data = self.reader.read(BytesIO(b'{"Database": {"Host": "localhost", "timeout": 1.5}}'))
+        self.assertIsInstance(data.get('database'), IgnoreCaseDict)
+        self.assertEqual(data.get('database').get('host'), 'localhost')
+        self.assertEqual(data.get('database').get('timeout'), 1.5)
+
+    def test_library_not_installed(self):
+        from central import readers
+        ijson_tmp = readers.ijson
+        readers.ijson = None
+
+        with self.assertRaises(LibraryRequiredError):
+            IJsonReader()
+
+        readers.ijson = ijson_tmp
+
+    def test_library_older_version(self):
+        from central import readers
+
+        class IJson(object):
+            __version__ = '2.6.1'
+
+        ijson_tmp = readers.ijson
+        readers.ijson = IJson
+
+        with self.assertRaises(LibraryRequiredError):
+            IJsonReader()
+
+        readers.ijson = ijson_tmp
+
 
 class TestTomlReader(TestCase, ReaderMixin):
     def setUp(self):
@@ -76,6 +159,14 @@ class TestYamlReader(TestCase, ReaderMixin):
 
         readers.yaml = yaml_tmp
 
+    def test_read_python_object(self):
+        import yaml
+
+        stream = StringIO(u'key: !!python/object/apply:os.getcwd []\n')
+
+        with self.assertRaises(yaml.YAMLError):
+            self.reader.read(stream)
+
 
 class TestManageRenders(TestCase):
     def test_add_render_with_valid_parameters(self):
@@ -109,6 +200,12 @@ class TestManageRenders(TestCase):
         with self.assertRaises(TypeError):
             get_reader(123)
 
+    def test_get_render_instance(self):
+        reader = get_reader_instance(JsonReader)
+        self.assertIsInstance(reader, JsonReader)
+        self.assertIs(reader, get_reader_instance(JsonReader))
+        self.assertIsNot(reader, get_reader_instance(YamlReader))
+
     def test_remove_render_with_none_as_name(self):
         with self.assertRaises(TypeError):
             remove_reader(None)
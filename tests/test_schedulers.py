@@ -24,6 +24,27 @@ class TestFixedIntervalScheduler(TestCase):
     def test_interval_equal_to_zero(self):
         self.assertRaises(ValueError, FixedIntervalScheduler, interval=0)
 
+    def test_default_jitter(self):
+        scheduler = FixedIntervalScheduler()
+        self.assertEqual(0, scheduler.jitter)
+
+    def test_jitter_as_str(self):
+        with self.assertRaises(TypeError):
+            FixedIntervalScheduler(jitter='non number')
+
+    def test_jitter_less_than_zero(self):
+        self.assertRaises(ValueError, FixedIntervalScheduler, jitter=-1)
+
+    def test_schedule_with_jitter(self):
+        ev = Event()
+
+        scheduler = FixedIntervalScheduler(interval=0.001, jitter=0.01)
+        scheduler.schedule(lambda: ev.set())
+
+        self.assertTrue(ev.wait(0.5))  # wait half second
+
+        scheduler.close()
+
     def test_schedule_with_none_as_func(self):
         scheduler = FixedIntervalScheduler()
         self.assertRaises(TypeError, scheduler.schedule, func=None)
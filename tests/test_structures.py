@@ -9,6 +9,30 @@ class TestIgnoreCaseDict(TestCase):
         d = IgnoreCaseDict(key='value')
         self.assertEqual('value', d['key'])
 
+    def test_init_with_pairs(self):
+        d = IgnoreCaseDict([('Key1', 'value1'), ('key2', 'value2')])
+        self.assertEqual('value1', d['key1'])
+        self.assertEqual('value2', d['KEY2'])
+        self.assertEqual({'Key1', 'key2'}, set(d.keys()))
+
+    def test_update_with_dict(self):
+        d = IgnoreCaseDict(Key1='value1')
+        d.update({'KEY1': 'value1 updated', 'key2': 'value2'}, key3='value3')
+        self.assertEqual({'KEY1': 'value1 updated', 'key2': 'value2', 'key3': 'value3'}, dict(d))
+
+    def test_update_with_pairs(self):
+        d = IgnoreCaseDict()
+        d.update([('Key1', 'value1')])
+        self.assertEqual('value1', d['key1'])
+
+    def test_update_with_non_str_key(self):
+        with self.assertRaises(TypeError):
+            IgnoreCaseDict().update({1: 'value'})
+
+    def test_init_with_non_str_key(self):
+        with self.assertRaises(TypeError):
+            IgnoreCaseDict({1: 'value'})
+
     def test_copy(self):
         d = IgnoreCaseDict(key='value')
         d2 = d.copy()
@@ -1,11 +1,21 @@
 from __future__ import absolute_import
 
-from central.utils import merge_dict, EventHandler, Version
+from central.structures import IgnoreCaseDict
+from central.utils import get_file_ext, make_ignore_case, merge_dict, prefetch, EventHandler, Version
 from threading import Event
 from unittest import TestCase
 
 
 class TestUtils(TestCase):
+    def test_get_file_ext(self):
+        self.assertEqual('json', get_file_ext('config.json'))
+        self.assertEqual('json', get_file_ext('configs/config.dev.json'))
+        self.assertEqual('', get_file_ext('config'))
+        self.assertEqual('', get_file_ext('config.'))
+        self.assertEqual('', get_file_ext('.config'))
+        self.assertEqual('', get_file_ext('configs.d/config'))
+        self.assertEqual('json', get_file_ext('configs/..config.json'))
+
     def test_merge_with_non_dict(self):
         with self.assertRaises(TypeError):
             merge_dict('non dict', {})
@@ -51,6 +61,59 @@ class TestUtils(TestCase):
 
         self.assertEqual(base, expected)
 
+    def test_merge_keeps_sources_unchanged(self):
+        source1 = {'parent': {'child': {'key': 'value'}}}
+        source2 = {'parent': {'child': {'key': 'value 2'}, 'key2': 'value 3'}}
+
+        data = {}
+
+        merge_dict(data, source1, source2)
+
+        self.assertEqual({'parent': {'child': {'key': 'value 2'}, 'key2': 'value 3'}}, data)
+        self.assertEqual({'parent': {'child': {'key': 'value'}}}, source1)
+        self.assertEqual({'parent': {'child': {'key': 'value 2'}, 'key2': 'value 3'}}, source2)
+
+    def test_merge_flat_dict_into_ignore_case_dict(self):
+        from central.structures import IgnoreCaseDict
+
+        base = IgnoreCaseDict(Key1='value1', key2={'key3': 'value3'})
+
+        merge_dict(base, {'KEY1': 'value1 overridden', 'key2': 'value2 overridden'})
+
+        self.assertIsInstance(base, IgnoreCaseDict)
+        self.assertEqual({'KEY1': 'value1 overridden', 'key2': 'value2 overridden'}, dict(base))
+
+    def test_make_ignore_case(self):
+        data = make_ignore_case({'Key': {'Inner': 1}, 'List': [{'Item': 2}, [{'Nested': 3}], 4]})
+
+        self.assertIsInstance(data, IgnoreCaseDict)
+        self.assertEqual(1, data['key']['inner'])
+        self.assertEqual(2, data['list'][0]['item'])
+        self.assertEqual(3, data['list'][1][0]['nested'])
+        self.assertEqual(4, data['list'][2])
+
+    def test_make_ignore_case_with_ignore_case_dict(self):
+        data = IgnoreCaseDict(key='value')
+        self.assertIs(data, make_ignore_case(data))
+
+    def test_prefetch(self):
+        calls = []
+
+        def func(arg):
+            calls.append(arg)
+            if arg == 'error':
+                raise MemoryError()
+            return arg.upper()
+
+        prefetched = prefetch(func, ['a', 'b', 'a', 'error'])
+
+        self.assertEqual('A', prefetched('a'))
+        self.assertEqual('B', prefetched('b'))
+        self.assertIsNone(prefetched('a'))
+        self.assertIsNone(prefetched('c'))
+        self.assertIsNone(prefetched('error'))
+        self.assertEqual(['a', 'b', 'error'], sorted(calls))
+
 
 class TestEventHandler(TestCase):
     def test_init_after_add_func_with_func_value(self):
@@ -143,6 +206,25 @@ class TestEventHandler(TestCase):
 
         self.assertTrue(ev.is_set())
 
+    def test_call_with_callback_removed_while_called(self):
+        calls = []
+
+        def callback1():
+            calls.append(1)
+            handler.remove(callback1)
+
+        def callback2():
+            calls.append(2)
+
+        handler = EventHandler()
+        handler.add(callback1)
+        handler.add(callback2)
+
+        handler()
+        handler()
+
+        self.assertEqual([1, 2, 2], calls)
+
 
 class TestVersion(TestCase):
     def test_get_changed_with_default_value(self):